@@ -12,25 +12,44 @@
 # Import from standard library. https://docs.python.org/3/library/
 
 import argparse
+import bz2
+import contextlib
+import cProfile
+import difflib
+import fnmatch
+import gzip
+import hashlib
+import io
 import json
 import linecache
 import logging
+import lzma
+import math
 import os
+import re
 import signal
 import string
 import sys
+import threading
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import parse_qs, unquote, urlparse, urlunparse
 
 import psycopg2
+from psycopg2 import errorcodes, extensions, sql
 from senzing import G2Config, G2ConfigMgr, G2Exception
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Metadata
 
-__version__ = "1.1.18"  # See https://www.python.org/dev/peps/pep-0396/
+__version__ = "1.2.0"  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = "2022-08-04"
-__updated__ = "2025-02-10"
+__updated__ = "2026-10-19"
 
 # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-product-ids.md
 
@@ -66,20 +85,376 @@ UNSAFE_CHARACTER_LIST = [
 ]
 RESERVED_CHARACTER_LIST = [";", ",", "/", "?", ":", "@", "=", "&"]
 
+# Names supplied by configuration (tenant schemas, tablespaces, ...) must be plain,
+# lower-case PostgreSQL identifiers.
+# A tenant schema range like "tenant_{001..500}" expands to tenant_001 ... tenant_500.
+
+SQL_IDENTIFIER_REGEX = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+TENANT_SCHEMA_RANGE_REGEX = re.compile(r"\{(\d+)\.\.(\d+)\}")
+
+# Template databases are created from the maintenance database and named by version.
+
+MAINTENANCE_DATABASE = "postgres"
+TEMPLATE_DATABASE_PREFIX = "senzing_template_"
+
+# Compressed SQL input, recognized by file extension or magic bytes.
+
+SQL_COMPRESSION_FORMATS = {
+    "bz2": {"extensions": [".bz2"], "magic": b"BZh"},
+    "gzip": {"extensions": [".gz", ".gzip"], "magic": b"\x1f\x8b"},
+    "xz": {"extensions": [".xz"], "magic": b"\xfd7zXZ\x00"},
+    "zstd": {"extensions": [".zst", ".zstd"], "magic": b"\x28\xb5\x2f\xfd"},
+}
+
+# Tables emptied by "reset". The Senzing configuration (SYS_CFG and friends) is kept.
+
+RESET_TABLE_PATTERNS = ["LIB_FEAT*", "OBS_*", "RES_*", "DSRC_RECORD*", "SYS_EVAL_QUEUE"]
+SQL_INSERT_SYS_SEQUENCE_REGEX = re.compile(
+    r"^INSERT\s+INTO\s+SYS_SEQUENCE\b", re.IGNORECASE
+)
+
+# Columns compared only byte-for-byte. SENZING_C_COLLATION gives them, and their indexes, COLLATE "C".
+
+C_COLLATION_COLUMNS = [
+    "ENT_SRC_KEY",
+    "FEAT_HASH",
+    "OBS_ENT_HASH",
+    "RECORD_ID",
+    "UTYPE_CODE",
+]
+SQL_C_COLLATION_COLUMN_REGEX = re.compile(
+    r"\b({0})\s+((?:VAR)?CHAR\s*\(\s*\d+\s*\)|TEXT)(?!\s+COLLATE)".format(
+        "|".join(C_COLLATION_COLUMNS)
+    ),
+    re.IGNORECASE,
+)
+
+# SYS_EVAL_QUEUE layouts. MSG_ID and IX_EVAL_QUEUE keep their names, so engine queries are unchanged.
+# "bigserial" widens MSG_ID and tunes storage for insert/delete churn.
+
+EVAL_QUEUE_LAYOUTS = ["default", "bigserial"]
+EVAL_QUEUE_STORAGE_PARAMETERS = "fillfactor = 80, autovacuum_vacuum_scale_factor = 0, autovacuum_vacuum_threshold = 1000, autovacuum_analyze_scale_factor = 0, autovacuum_analyze_threshold = 1000, autovacuum_vacuum_cost_delay = 0"
+EVAL_QUEUE_INDEX_STORAGE_PARAMETERS = "fillfactor = 70"
+SQL_EVAL_QUEUE_KEY_REGEX = re.compile(
+    r"\bMSG_ID\s+SERIAL\s+PRIMARY\s+KEY\b", re.IGNORECASE
+)
+
+# Large TEXT columns. SENZING_COLUMN_COMPRESSION compresses them with lz4 and sets their storage strategy.
+# MAIN keeps mid-sized values compressed in the row; EXTENDED lets large ones move out of line.
+
+COMPRESSED_COLUMNS = {
+    "DSRC_RECORD": {"JSON_DATA": "EXTENDED"},
+    "LIB_FEAT": {"FELEM_VALUES": "MAIN"},
+    "OBS_ENT": {"FEATURES": "EXTENDED"},
+    "RES_ENT_OKEY": {"MATCH_KEY": "MAIN"},
+    "RES_RELATE": {"MATCH_KEY": "MAIN"},
+    "SYS_CFG": {"CONFIG_DATA": "EXTENDED"},
+}
+COMPRESSION_REPORT_SAMPLE_ROWS = 10000
+
+# Values are only compressed in rows wider than the TOAST threshold, about 2 kB.
+# compression-report pads each sampled value past it with an uncompressed filler.
+
+COMPRESSION_REPORT_FILLER_BYTES = 2100
+COMPRESSION_STORAGE_STRATEGIES = {
+    "p": "PLAIN",
+    "e": "EXTERNAL",
+    "m": "MAIN",
+    "x": "EXTENDED",
+}
+
+# Write-heavy tables that SENZING_UNLOGGED_TABLES creates UNLOGGED for an initial load.
+
+UNLOGGED_TABLES = ["DSRC_RECORD", "LIB_FEAT", "OBS_FEAT_EKEY", "RES_FEAT_EKEY"]
+
+# SQL file statements run with short lock and statement timeouts and are retried on lock timeouts.
+
+DDL_RETRY_BACKOFF_IN_SECONDS = 1
+DDL_RETRY_MAX_BACKOFF_IN_SECONDS = 30
+SQL_DURATION_REGEX = re.compile(r"^\d+\s*(us|ms|s|min|h|d)?$")
+SQL_STATEMENT_RELATION_REGEX = re.compile(
+    r"^(?:CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?\w+\s+ON|ALTER\s+TABLE|DROP\s+TABLE|INSERT\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?|LOCK(?:\s+TABLE)?)\s+(?:ONLY\s+)?(?:IF\s+EXISTS\s+)?(\w+)",
+    re.IGNORECASE,
+)
+
+# Preflight checks run before any DDL.
+
+PREFLIGHT_CONNECT_TIMEOUT_IN_SECONDS = 10
+PREFLIGHT_LATENCY_WARNING_IN_MILLISECONDS = 20
+PREFLIGHT_MINIMUM_SERVER_VERSION_NUM = 110000
+PREFLIGHT_ROUND_TRIPS = 5
+
+# Progress journal kept in each database (or tenant schema) so an interrupted run resumes.
+
+JOURNAL_TABLE_DDL = "CREATE TABLE IF NOT EXISTS INIT_POSTGRESQL_JOURNAL (PHASE VARCHAR(50) NOT NULL, STEP_HASH CHAR(64) NOT NULL, STEP VARCHAR(250), FINISHED_AT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY(PHASE, STEP_HASH))"
+
+# With a progress journal, only errors from re-creating what already exists are tolerated.
+
+SQL_ALREADY_EXISTS_SQLSTATES = [
+    errorcodes.DUPLICATE_COLUMN,
+    errorcodes.DUPLICATE_DATABASE,
+    errorcodes.DUPLICATE_FUNCTION,
+    errorcodes.DUPLICATE_OBJECT,
+    errorcodes.DUPLICATE_SCHEMA,
+    errorcodes.DUPLICATE_TABLE,
+    errorcodes.UNIQUE_VIOLATION,
+]
+
+# Key of the PostgreSQL advisory lock that serializes concurrent init-postgresql instances.
+
+ADVISORY_LOCK_KEY = int(SENZING_PRODUCT_ID) * 1000000 + 1
+
+# Statements in the SQL file are one per line. These recognize the ones that create objects.
+
+SQL_CREATE_TABLE_REGEX = re.compile(
+    r"^CREATE\s+(?:UNLOGGED\s+)?TABLE\s+(\w+)\s*\((.*)\)\s*(.*?)\s*;?\s*$",
+    re.IGNORECASE,
+)
+SQL_CREATE_INDEX_REGEX = re.compile(
+    r"^CREATE\s+(UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*(?:USING\s+\w+\s*)?\((.*?)\)\s*(.*?)\s*;?\s*$",
+    re.IGNORECASE,
+)
+SQL_PRIMARY_KEY_REGEX = re.compile(r"PRIMARY KEY(\s*\([^)]*\))?", re.IGNORECASE)
+
+# Load test rows use negative identifiers and this SYS_SEQUENCE name.
+
+LOADTEST_SEQUENCE_NAME = "INIT_POSTGRESQL_LOADTEST"
+LOADTEST_CLEANUP_STATEMENTS = {
+    "LIB_FEAT": "DELETE FROM LIB_FEAT WHERE LIB_FEAT_ID < 0",
+    "LIB_FEAT_HKEY": "DELETE FROM LIB_FEAT_HKEY WHERE LIB_FEAT_ID < 0",
+    "OBS_ENT": "DELETE FROM OBS_ENT WHERE OBS_ENT_ID < 0",
+    "OBS_ENT_SKEY": "DELETE FROM OBS_ENT_SKEY WHERE OBS_ENT_ID < 0",
+    "RES_ENT_OKEY": "DELETE FROM RES_ENT_OKEY WHERE OBS_ENT_ID < 0",
+    "SYS_SEQUENCE": "DELETE FROM SYS_SEQUENCE WHERE SEQUENCE_NAME = '{0}'".format(
+        LOADTEST_SEQUENCE_NAME
+    ),
+}
+
+# The tables each load test write pattern writes to.
+
+LOADTEST_PATTERN_TABLES = {
+    "LIB_FEAT": ["LIB_FEAT", "LIB_FEAT_HKEY"],
+    "OBS_ENT": ["OBS_ENT", "OBS_ENT_SKEY"],
+    "RES_ENT_OKEY": ["RES_ENT_OKEY"],
+    "SYS_SEQUENCE": ["SYS_SEQUENCE"],
+}
+
+# Capacity planning. Rows of each table are a multiple of a workload unit.
+
+CAPACITY_TABLE_ROWS = {
+    "DSRC_RECORD": ("records", 1.0),
+    "DSRC_RECORD_HKEY": ("records", 1.0),
+    "LIB_FEAT": ("distinct_features", 1.0),
+    "LIB_FEAT_HKEY": ("distinct_features", 1.0),
+    "OBS_ENT": ("records", 1.0),
+    "OBS_ENT_SKEY": ("records", 1.0),
+    "OBS_FEAT_EKEY": ("features", 1.0),
+    "RES_ENT": ("entities", 1.0),
+    "RES_ENT_OKEY": ("records", 1.0),
+    "RES_ENT_RKEY": ("records", 1.0),
+    "RES_FEAT_EKEY": ("features", 0.8),
+    "RES_FEAT_LKEY": ("features", 0.8),
+    "RES_FEAT_STAT": ("distinct_features", 1.0),
+    "RES_REL_EKEY": ("relationships", 2.0),
+    "RES_RELATE": ("relationships", 1.0),
+    "SYS_EVAL_QUEUE": ("records", 0.01),
+}
+CAPACITY_CROSS_SOURCE_MATCH_RATE = 0.25
+CAPACITY_DISTINCT_FEATURE_RATIO = 0.4
+CAPACITY_ENTITIES_PER_RECORD = 0.9
+CAPACITY_RELATIONSHIPS_PER_ENTITY = 0.5
+
+# Indexes of these tables are probed for every record loaded, so they should stay cached.
+
+CAPACITY_HOT_TABLES = [
+    "DSRC_RECORD",
+    "DSRC_RECORD_HKEY",
+    "LIB_FEAT",
+    "LIB_FEAT_HKEY",
+    "OBS_ENT",
+    "OBS_ENT_SKEY",
+    "RES_FEAT_EKEY",
+    "RES_FEAT_LKEY",
+    "RES_FEAT_STAT",
+]
+
+# Average stored widths in bytes. VARCHAR columns are assumed a quarter full.
+
+CAPACITY_COLUMN_WIDTHS = {
+    "BIGINT": 8,
+    "BIGSERIAL": 8,
+    "INT": 4,
+    "INTEGER": 4,
+    "SERIAL": 4,
+    "SMALLINT": 2,
+    "TIMESTAMP": 8,
+}
+CAPACITY_TEXT_COLUMN_WIDTHS = {
+    "CONFIG_DATA": 2000,
+    "FEATURES": 400,
+    "FELEM_VALUES": 60,
+    "JSON_DATA": 1000,
+    "MATCH_KEY": 30,
+    "MSG": 500,
+}
+CAPACITY_TEXT_WIDTH = 100
+CAPACITY_VARCHAR_FILL = 0.25
+
+# PostgreSQL page layout. B-tree leaves fill to about 70% under random-key inserts.
+
+CAPACITY_PAGE_SIZE = 8192
+CAPACITY_PAGE_HEADER = 24
+CAPACITY_HEAP_TUPLE_HEADER = 24
+CAPACITY_INDEX_TUPLE_HEADER = 8
+CAPACITY_LINE_POINTER = 4
+CAPACITY_HASH_KEY_WIDTH = 4
+CAPACITY_INDEX_FILL = {"btree": 0.7, "hash": 0.75}
+CAPACITY_WAL_RECORD_OVERHEAD = 50
+CAPACITY_SAMPLE_ROWS = 10000
+SQL_COLUMN_DEFINITION_REGEX = re.compile(
+    r"^(\w+)\s+(\w+)(?:\s*\(\s*(\d+)\s*\))?(.*)$", re.IGNORECASE
+)
+SQL_FILLFACTOR_REGEX = re.compile(r"\bfillfactor\s*=\s*(\d+)", re.IGNORECASE)
+SQL_INDEX_COLUMNS_REGEX = re.compile(
+    r"^CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*(?:USING\s+(\w+)\s*)?\(([^)]*)\)(?:\s*INCLUDE\s*\(([^)]*)\))?",
+    re.IGNORECASE,
+)
+
+# Server tuning rules for Senzing workloads.
+
+SETTING_UNIT_MULTIPLIERS = {
+    "B": 1,
+    "kB": KILOBYTES,
+    "8kB": 8 * KILOBYTES,
+    "16MB": 16 * MEGABYTES,
+    "MB": MEGABYTES,
+    "GB": GIGABYTES,
+    "ms": 0.001,
+    "s": 1,
+    "min": 60,
+}
+TUNING_CHECKPOINT_TIMEOUT = 15 * 60
+TUNING_CONNECTION_HEADROOM = 20
+TUNING_EFFECTIVE_IO_CONCURRENCY = 200
+TUNING_MAX_WAL_SIZE = 16 * GIGABYTES
+TUNING_PRIORITIES = {1: "high", 2: "medium", 3: "low"}
+
+# Session settings profiles pinned with ALTER ROLE ... IN DATABASE ... SET.
+# JIT compilation only slows the short OLTP queries the Senzing engine issues.
+# "loader" also trades durability of the last few commits for throughput.
+
+SESSION_SETTINGS_PROFILES = {
+    "oltp": {
+        "jit": "off",
+        "work_mem": "16MB",
+    },
+    "loader": {
+        "jit": "off",
+        "synchronous_commit": "off",
+        "work_mem": "16MB",
+    },
+}
+SESSION_SETTING_NAME_REGEX = re.compile(r"^[a-z_][a-z0-9_.]*$")
+
+# init-postgresql records the choices it made in SYS_VARS under this VAR_GROUP.
+
+SYS_VARS_GROUP = "INIT_POSTGRESQL"
+
+# Index profiles. "replace" maps an index name in the SQL file to the statement used instead.
+# "add" maps a table name to statements run right after the table is created.
+# FEAT_HASH and OBS_ENT_HASH are fixed-width hashes only used in equality lookups.
+
+COVERING_INDEXES = {
+    "DSRC_RECORD_SK": "CREATE INDEX DSRC_RECORD_SK ON DSRC_RECORD(ENT_SRC_KEY, DSRC_ID) INCLUDE (RECORD_ID) ;",
+    "LIB_FEAT_SK": "CREATE UNIQUE INDEX LIB_FEAT_SK ON LIB_FEAT(FEAT_HASH, FTYPE_ID, ANONYMIZED) INCLUDE (LIB_FEAT_ID) ;",
+    "OBS_ENT_SK": "CREATE UNIQUE INDEX OBS_ENT_SK ON OBS_ENT(ENT_SRC_KEY, DSRC_ID) INCLUDE (OBS_ENT_ID, ETYPE_ID) ;",
+    "RES_ENT_OKEY_SK": "CREATE UNIQUE INDEX RES_ENT_OKEY_SK ON RES_ENT_OKEY(RES_ENT_ID, LENS_ID, OBS_ENT_ID) INCLUDE (ER_ID, ERRULE_ID) ;",
+    "RES_FEAT_EKEY_SK": "CREATE UNIQUE INDEX RES_FEAT_EKEY_SK ON RES_FEAT_EKEY(LIB_FEAT_ID, LENS_ID, RES_ENT_ID, UTYPE_CODE) INCLUDE (FTYPE_ID, ECLASS_ID) ;",
+    "SYS_CODES_USED_SK": "CREATE UNIQUE INDEX SYS_CODES_USED_SK ON SYS_CODES_USED(CODE_TYPE, CODE_ID) INCLUDE (CODE) ;",
+}
+
+INDEX_PROFILES = {
+    "default": {
+        "replace": {},
+        "add": {},
+    },
+    "covering": {
+        "replace": COVERING_INDEXES,
+        "add": {},
+    },
+    "hash": {
+        "replace": dict(
+            COVERING_INDEXES,
+            DSRC_RECORD_HK="CREATE INDEX DSRC_RECORD_HK ON DSRC_RECORD USING HASH (OBS_ENT_HASH) ;",
+        ),
+        "add": {
+            "DSRC_RECORD_HKEY": [
+                "CREATE INDEX DSRC_RECORD_HKEY_HX ON DSRC_RECORD_HKEY USING HASH (OBS_ENT_HASH) ;"
+            ],
+        },
+    },
+}
+
 # Singletons
 
+DATABASE_CONNECTION_MANAGER_SINGLETON = None
 G2_CONFIG_SINGLETON = None
 G2_CONFIGURATION_MANAGER_SINGLETON = None
+TRACER_SINGLETON = None
+
+# Caches
+
+PARSED_DATABASE_URL_CACHE = {}
 
 # The "configuration_locator" describes where configuration variables are in:
 # 1) Command line options, 2) Environment variables, 3) Configuration files, 4) Default values
 
 CONFIGURATION_LOCATOR = {
+    "c_collation": {
+        "default": False,
+        "env": "SENZING_C_COLLATION",
+        "cli": "c-collation",
+    },
+    "capacity_data_sources": {
+        "default": 1,
+        "env": "SENZING_CAPACITY_DATA_SOURCES",
+        "cli": "capacity-data-sources",
+    },
+    "capacity_features_per_record": {
+        "default": 10,
+        "env": "SENZING_CAPACITY_FEATURES_PER_RECORD",
+        "cli": "capacity-features-per-record",
+    },
+    "capacity_output_file": {
+        "default": None,
+        "env": "SENZING_CAPACITY_OUTPUT_FILE",
+        "cli": "capacity-output-file",
+    },
+    "capacity_records": {
+        "default": 0,
+        "env": "SENZING_CAPACITY_RECORDS",
+        "cli": "capacity-records",
+    },
+    "column_compression": {
+        "default": False,
+        "env": "SENZING_COLUMN_COMPRESSION",
+        "cli": "column-compression",
+    },
+    "configuration_file": {
+        "default": None,
+        "env": "SENZING_CONFIGURATION_FILE",
+        "cli": "configuration-file",
+    },
     "configuration_modifications": {
         "default": None,
         "env": "SENZING_CONFIGURATION_MODIFICATIONS",
         "cli": "configuration-modifications",
     },
+    "configuration_modifications_file": {
+        "default": None,
+        "env": "SENZING_CONFIGURATION_MODIFICATIONS_FILE",
+        "cli": "configuration-modifications-file",
+    },
     "data_dir": {
         "default": "/opt/senzing/data",
         "env": "SENZING_DATA_DIR",
@@ -90,6 +465,21 @@ CONFIGURATION_LOCATOR = {
         "env": "SENZING_DATABASE_URL",
         "cli": "database-url",
     },
+    "ddl_lock_timeout": {
+        "default": "5s",
+        "env": "SENZING_DDL_LOCK_TIMEOUT",
+        "cli": "ddl-lock-timeout",
+    },
+    "ddl_retries": {
+        "default": 5,
+        "env": "SENZING_DDL_RETRIES",
+        "cli": "ddl-retries",
+    },
+    "ddl_statement_timeout": {
+        "default": "0",
+        "env": "SENZING_DDL_STATEMENT_TIMEOUT",
+        "cli": "ddl-statement-timeout",
+    },
     "debug": {"default": False, "env": "SENZING_DEBUG", "cli": "debug"},
     "engine_configuration_json": {
         "default": None,
@@ -101,17 +491,66 @@ CONFIGURATION_LOCATOR = {
         "env": "SENZING_ETC_DIR",
         "cli": "etc-dir",
     },
+    "eval_queue_layout": {
+        "default": "default",
+        "env": "SENZING_EVAL_QUEUE_LAYOUT",
+        "cli": "eval-queue-layout",
+    },
     "g2_dir": {"default": "/opt/senzing/g2", "env": "SENZING_G2_DIR", "cli": "g2-dir"},
+    "index_profile": {
+        "default": None,
+        "env": "SENZING_INDEX_PROFILE",
+        "cli": "index-profile",
+    },
     "input_sql_url": {
         "default": "/opt/senzing/g2/resources/schema/g2core-schema-postgresql-create.sql",
         "env": "SENZING_INPUT_SQL_URL",
         "cli": "input-sql-url",
     },
+    "loadtest_iterations": {
+        "default": 1000,
+        "env": "SENZING_LOADTEST_ITERATIONS",
+        "cli": "loadtest-iterations",
+    },
+    "loadtest_threads": {
+        "default": 8,
+        "env": "SENZING_LOADTEST_THREADS",
+        "cli": "loadtest-threads",
+    },
     "log_level_parameter": {
         "default": "info",
         "env": "SENZING_LOG_LEVEL",
         "cli": "log-level-parameter",
     },
+    "max_connections_per_database": {
+        "default": 8,
+        "env": "SENZING_MAX_CONNECTIONS_PER_DATABASE",
+        "cli": "max-connections-per-database",
+    },
+    "profile_file": {
+        "env": "SENZING_PROFILE_FILE",
+        "cli": "profile",
+    },
+    "reconcile_interval_in_seconds": {
+        "default": 10,
+        "env": "SENZING_RECONCILE_INTERVAL_IN_SECONDS",
+        "cli": "reconcile-interval-in-seconds",
+    },
+    "reset_confirmed": {
+        "default": False,
+        "env": "SENZING_RESET_CONFIRMED",
+        "cli": "confirm-reset",
+    },
+    "resume": {
+        "default": False,
+        "env": "SENZING_RESUME",
+        "cli": "resume",
+    },
+    "session_settings": {
+        "default": None,
+        "env": "SENZING_SESSION_SETTINGS",
+        "cli": "session-settings",
+    },
     "sleep_time_in_seconds": {
         "default": 0,
         "env": "SENZING_SLEEP_TIME_IN_SECONDS",
@@ -121,11 +560,66 @@ CONFIGURATION_LOCATOR = {
         "default": None,
         "env": "SENZING_SUBCOMMAND",
     },
+    "tablespace_map": {
+        "default": None,
+        "env": "SENZING_TABLESPACE_MAP",
+        "cli": "tablespace-map",
+    },
+    "tablespace_move_existing": {
+        "default": False,
+        "env": "SENZING_TABLESPACE_MOVE_EXISTING",
+        "cli": "tablespace-move-existing",
+    },
+    "tenant_schemas": {
+        "default": None,
+        "env": "SENZING_TENANT_SCHEMAS",
+        "cli": "tenant-schemas",
+    },
+    "tenant_threads": {
+        "default": 8,
+        "env": "SENZING_TENANT_THREADS",
+        "cli": "tenant-threads",
+    },
+    "trace_file": {
+        "env": "SENZING_TRACE_FILE",
+        "cli": "trace-file",
+    },
+    "tune_loader_nodes": {
+        "default": 1,
+        "env": "SENZING_TUNE_LOADER_NODES",
+        "cli": "tune-loader-nodes",
+    },
+    "tune_loader_threads": {
+        "default": 0,
+        "env": "SENZING_TUNE_LOADER_THREADS",
+        "cli": "tune-loader-threads",
+    },
+    "tune_memory_in_gigabytes": {
+        "default": 0,
+        "env": "SENZING_TUNE_MEMORY_IN_GIGABYTES",
+        "cli": "tune-memory-in-gigabytes",
+    },
+    "tune_output_file": {
+        "default": None,
+        "env": "SENZING_TUNE_OUTPUT_FILE",
+        "cli": "tune-output-file",
+    },
+    "unlogged_tables": {
+        "default": False,
+        "env": "SENZING_UNLOGGED_TABLES",
+        "cli": "unlogged-tables",
+    },
+    "use_template_database": {
+        "default": False,
+        "env": "SENZING_USE_TEMPLATE_DATABASE",
+        "cli": "use-template-database",
+    },
 }
 
 # Enumerate keys in 'configuration_locator' that should not be printed to the log.
 
 KEYS_TO_REDACT = [
+    "cloned_database_urls",
     "database_url",
     "engine_configuration_json",
 ]
@@ -139,9 +633,58 @@ def get_parser():
     """Parse commandline arguments."""
 
     subcommands = {
+        "config-export": {
+            "help": "Write the default Senzing configuration to SENZING_CONFIGURATION_FILE.",
+            "argument_aspects": ["common", "configuration_file"],
+        },
+        "config-import": {
+            "help": "Make the Senzing configuration in SENZING_CONFIGURATION_FILE the default.",
+            "argument_aspects": ["common", "configuration_file"],
+        },
         "mandatory": {
             "help": "Perform mandatory initialization tasks.",
-            "argument_aspects": ["common", "init_sql"],
+            "argument_aspects": [
+                "common",
+                "configuration_file",
+                "init_sql",
+                "template",
+            ],
+        },
+        "tenants": {
+            "help": "Perform mandatory initialization tasks for many tenant schemas in one database.",
+            "argument_aspects": ["common", "configuration_file", "init_sql", "tenants"],
+        },
+        "tune": {
+            "help": "Recommend PostgreSQL server settings for Senzing workloads.",
+            "argument_aspects": ["common", "tune"],
+        },
+        "plan-capacity": {
+            "help": "Project table, index and WAL sizes per database from expected record counts. TEXT columns count uncompressed unless sampled from loaded rows.",
+            "argument_aspects": ["common", "capacity"],
+        },
+        "loadtest": {
+            "help": "Measure Senzing-shaped write throughput and latency, then clean up.",
+            "argument_aspects": ["common", "loadtest"],
+        },
+        "finalize": {
+            "help": "Switch UNLOGGED tables back to logged after an initial load.",
+            "argument_aspects": ["common"],
+        },
+        "compression-report": {
+            "help": "Compare stored sizes of large TEXT columns with their pglz and lz4 compressed sizes.",
+            "argument_aspects": ["common"],
+        },
+        "preflight": {
+            "help": "Check that every database is reachable, recent enough and writable, without changing anything.",
+            "argument_aspects": ["common", "template"],
+        },
+        "reconcile": {
+            "help": "Perform mandatory initialization tasks, then keep applying changes to the modifications and SQL files.",
+            "argument_aspects": ["common", "init_sql", "reconcile", "template"],
+        },
+        "reset": {
+            "help": "Remove all entity resolution data, keeping the Senzing configuration.",
+            "argument_aspects": ["common", "reset"],
         },
         "sleep": {
             "help": "Do nothing but sleep. For Docker testing.",
@@ -185,6 +728,16 @@ def get_parser():
                 "metavar": "SENZING_ENGINE_CONFIGURATION_JSON",
                 "help": "Advanced Senzing engine configuration. Default: none",
             },
+            "--profile": {
+                "dest": "profile_file",
+                "metavar": "SENZING_PROFILE_FILE",
+                "help": "Write cProfile statistics of the subcommand to this pstats file. Default: none",
+            },
+            "--trace-file": {
+                "dest": "trace_file",
+                "metavar": "SENZING_TRACE_FILE",
+                "help": "Append a JSON line per SQL statement and G2 call to this file. Default: none",
+            },
             "--etc-dir": {
                 "dest": "etc_dir",
                 "metavar": "SENZING_ETC_DIR",
@@ -195,12 +748,203 @@ def get_parser():
                 "metavar": "SENZING_G2_DIR",
                 "help": "Path to Senzing binaries. Default: /opt/senzing/g2",
             },
+            "--max-connections-per-database": {
+                "dest": "max_connections_per_database",
+                "metavar": "SENZING_MAX_CONNECTIONS_PER_DATABASE",
+                "help": "Size of the pool of reusable connections to each database. Default: 8",
+            },
         },
         "init_sql": {
             "--input-sql-url": {
                 "dest": "input_sql_url",
                 "metavar": "SENZING_INPUT_SQL_URL",
-                "help": "file:// or http:// location of file of SQL statements. Default: none",
+                "help": "file:// or http:// location of file of SQL statements, optionally gzip, bzip2, xz, or zstd compressed. Default: none",
+            },
+            "--index-profile": {
+                "dest": "index_profile",
+                "metavar": "SENZING_INDEX_PROFILE",
+                "help": "Index profile: default, covering, or hash. Default: the profile recorded in SYS_VARS, else default",
+            },
+            "--eval-queue-layout": {
+                "dest": "eval_queue_layout",
+                "metavar": "SENZING_EVAL_QUEUE_LAYOUT",
+                "help": "SYS_EVAL_QUEUE layout: default or bigserial. Default: default",
+            },
+            "--session-settings": {
+                "dest": "session_settings",
+                "metavar": "SENZING_SESSION_SETTINGS",
+                "help": 'Session settings pinned for the database user: "oltp", "loader", or a JSON object such as {"jit": "off"}. Default: none',
+            },
+            "--tablespace-map": {
+                "dest": "tablespace_map",
+                "metavar": "SENZING_TABLESPACE_MAP",
+                "help": 'JSON object of table/index name patterns to tablespaces. Example: {"LIB_FEAT_HKEY*": "fast"} Default: none',
+            },
+            "--tablespace-move-existing": {
+                "dest": "tablespace_move_existing",
+                "action": "store_true",
+                "help": "Move existing tables and indexes to the tablespaces in SENZING_TABLESPACE_MAP. (SENZING_TABLESPACE_MOVE_EXISTING) Default: False",
+            },
+            "--resume": {
+                "dest": "resume",
+                "action": "store_true",
+                "help": "Keep a progress journal in each database and skip work a previous run finished. (SENZING_RESUME) Default: False",
+            },
+            "--ddl-lock-timeout": {
+                "dest": "ddl_lock_timeout",
+                "metavar": "SENZING_DDL_LOCK_TIMEOUT",
+                "help": "lock_timeout for SQL file statements, e.g. 5s. Default: 5s",
+            },
+            "--ddl-retries": {
+                "dest": "ddl_retries",
+                "metavar": "SENZING_DDL_RETRIES",
+                "help": "Retries, with backoff, of a statement that hit the lock_timeout. Default: 5",
+            },
+            "--ddl-statement-timeout": {
+                "dest": "ddl_statement_timeout",
+                "metavar": "SENZING_DDL_STATEMENT_TIMEOUT",
+                "help": "statement_timeout for SQL file statements, e.g. 30min. Default: 0 (none)",
+            },
+            "--c-collation": {
+                "dest": "c_collation",
+                "action": "store_true",
+                "help": 'Create hash and key columns, and so their indexes, with COLLATE "C". (SENZING_C_COLLATION) Default: False',
+            },
+            "--column-compression": {
+                "dest": "column_compression",
+                "action": "store_true",
+                "help": "Compress large TEXT columns with lz4 where the server supports it, and set their storage strategy. (SENZING_COLUMN_COMPRESSION) Default: False",
+            },
+            "--unlogged-tables": {
+                "dest": "unlogged_tables",
+                "action": "store_true",
+                "help": "Create the write-heavy tables UNLOGGED for an initial load. Run finalize afterwards. (SENZING_UNLOGGED_TABLES) Default: False",
+            },
+        },
+        "configuration_file": {
+            "--configuration-file": {
+                "dest": "configuration_file",
+                "metavar": "SENZING_CONFIGURATION_FILE",
+                "help": "Senzing configuration JSON snapshot. Used instead of creating and modifying a configuration. Default: none",
+            },
+        },
+        "template": {
+            "--use-template-database": {
+                "dest": "use_template_database",
+                "action": "store_true",
+                "help": "Create missing databases by cloning a versioned template database. (SENZING_USE_TEMPLATE_DATABASE) Default: False",
+            },
+        },
+        "reconcile": {
+            "--configuration-modifications-file": {
+                "dest": "configuration_modifications_file",
+                "metavar": "SENZING_CONFIGURATION_MODIFICATIONS_FILE",
+                "help": "File of line-break delimited configuration modifications to watch. Default: none",
+            },
+            "--reconcile-interval-in-seconds": {
+                "dest": "reconcile_interval_in_seconds",
+                "metavar": "SENZING_RECONCILE_INTERVAL_IN_SECONDS",
+                "help": "How often watched files are checked for changes. Default: 10",
+            },
+        },
+        "reset": {
+            "--confirm-reset": {
+                "dest": "reset_confirmed",
+                "action": "store_true",
+                "help": "Required. Acknowledge that all entity resolution data is deleted. (SENZING_RESET_CONFIRMED) Default: False",
+            },
+            "--input-sql-url": {
+                "dest": "input_sql_url",
+                "metavar": "SENZING_INPUT_SQL_URL",
+                "help": "file:// or http:// location of file of SQL statements. SYS_SEQUENCE seed values are read from it. Default: none",
+            },
+        },
+        "capacity": {
+            "--capacity-data-sources": {
+                "dest": "capacity_data_sources",
+                "metavar": "SENZING_CAPACITY_DATA_SOURCES",
+                "help": "Number of data sources. More sources mean more records resolve together. Default: 1",
+            },
+            "--capacity-features-per-record": {
+                "dest": "capacity_features_per_record",
+                "metavar": "SENZING_CAPACITY_FEATURES_PER_RECORD",
+                "help": "Average features (names, addresses, identifiers...) per record. Default: 10",
+            },
+            "--capacity-output-file": {
+                "dest": "capacity_output_file",
+                "metavar": "SENZING_CAPACITY_OUTPUT_FILE",
+                "help": "File to receive the projections as JSON. Default: none",
+            },
+            "--capacity-records": {
+                "dest": "capacity_records",
+                "metavar": "SENZING_CAPACITY_RECORDS",
+                "help": "Required. Number of records expected to be loaded. Default: 0, which must be overridden",
+            },
+            "--index-profile": {
+                "dest": "index_profile",
+                "metavar": "SENZING_INDEX_PROFILE",
+                "help": "Index profile: default, covering, or hash. Default: default",
+            },
+            "--eval-queue-layout": {
+                "dest": "eval_queue_layout",
+                "metavar": "SENZING_EVAL_QUEUE_LAYOUT",
+                "help": "SYS_EVAL_QUEUE layout: default or bigserial. Default: default",
+            },
+            "--input-sql-url": {
+                "dest": "input_sql_url",
+                "metavar": "SENZING_INPUT_SQL_URL",
+                "help": "file:// or http:// location of file of SQL statements. Table and index definitions are read from it. Default: none",
+            },
+            "--unlogged-tables": {
+                "dest": "unlogged_tables",
+                "action": "store_true",
+                "help": "Plan for UNLOGGED hot tables, which write no WAL during the initial load. (SENZING_UNLOGGED_TABLES) Default: False",
+            },
+        },
+        "loadtest": {
+            "--loadtest-iterations": {
+                "dest": "loadtest_iterations",
+                "metavar": "SENZING_LOADTEST_ITERATIONS",
+                "help": "Operations per thread for each write pattern. Default: 1000",
+            },
+            "--loadtest-threads": {
+                "dest": "loadtest_threads",
+                "metavar": "SENZING_LOADTEST_THREADS",
+                "help": "Number of concurrent threads. Default: 8",
+            },
+        },
+        "tune": {
+            "--tune-loader-nodes": {
+                "dest": "tune_loader_nodes",
+                "metavar": "SENZING_TUNE_LOADER_NODES",
+                "help": "Number of nodes running Senzing loaders. Default: 1",
+            },
+            "--tune-loader-threads": {
+                "dest": "tune_loader_threads",
+                "metavar": "SENZING_TUNE_LOADER_THREADS",
+                "help": "Number of Senzing loader threads per node. Default: 0 (unknown)",
+            },
+            "--tune-memory-in-gigabytes": {
+                "dest": "tune_memory_in_gigabytes",
+                "metavar": "SENZING_TUNE_MEMORY_IN_GIGABYTES",
+                "help": "Memory available to the PostgreSQL server. Default: 0 (unknown)",
+            },
+            "--tune-output-file": {
+                "dest": "tune_output_file",
+                "metavar": "SENZING_TUNE_OUTPUT_FILE",
+                "help": "File to receive an ALTER SYSTEM script. With several servers, one file per server, named with -<host>-<port> before the extension. Default: none",
+            },
+        },
+        "tenants": {
+            "--tenant-schemas": {
+                "dest": "tenant_schemas",
+                "metavar": "SENZING_TENANT_SCHEMAS",
+                "help": "Comma-separated tenant schema names. Ranges like tenant_{001..500} are expanded. Default: none",
+            },
+            "--tenant-threads": {
+                "dest": "tenant_threads",
+                "metavar": "SENZING_TENANT_THREADS",
+                "help": "Number of tenant schemas provisioned concurrently. Default: 8",
             },
         },
     }
@@ -256,6 +1000,46 @@ MESSAGE_DICTIONARY = {
     "171": "Default config in SYS_CFG already exists having ID {0}",
     "172": "Created data source: {0}.  Response: {1}",
     "173": "Created new config in SYS_CFG having Name: {0} ID: {1}",
+    "174": "Created schema: {0}",
+    "175": "Provisioned {0} of {1} tenant schemas in {2:.2f} seconds. Failed: {3}",
+    "176": "Created template database: {0}",
+    "177": "Created database {0} from template database {1}",
+    "178": "Dropped stale template database: {0}",
+    "179": "Waiting for another init-postgresql to release database {0}",
+    "180": "Database {0} was initialized by another init-postgresql. Skipping SQL file.",
+    "181": "Moved {0} to tablespace {1}",
+    "182": "{0}: [{1}] {2} = {3} (current: {4}). {5}",
+    "183": "{0}: PostgreSQL {1}. No setting changes recommended.",
+    "184": "{0}: PostgreSQL {1}. {2} setting changes recommended.",
+    "185": "SENZING_TUNE_MEMORY_IN_GIGABYTES is not set. Skipping memory-based recommendations.",
+    "186": "SENZING_TUNE_LOADER_THREADS is not set. Skipping max_connections recommendation.",
+    "187": "{0}: Wrote ALTER SYSTEM script to {1}",
+    "188": "{0}: Set {1} = {2} for user {3}",
+    "189": "{0}: Session settings for user {1} match SENZING_SESSION_SETTINGS",
+    "190": "{0}: {1} operations, {2} errors in {3:.2f} seconds = {4:.0f} operations/second. Latency in ms: p50 {5:.2f}, p95 {6:.2f}, p99 {7:.2f}, max {8:.2f}",
+    "191": "Removed load test rows.",
+    "192": "{0}: Resumed. Skipped {1} SQL statements finished by a previous run.",
+    "193": "Configuration modifications were already applied. Skipping.",
+    "194": "Exported Senzing configuration ID {0} to {1}",
+    "195": "Senzing configuration in {0} is already the default, ID {1}",
+    "196": "Imported Senzing configuration from {0} as default configuration ID {1}",
+    "197": "{0}: Truncated {1} tables and restored {2} SYS_SEQUENCE rows in {3:.2f} seconds.",
+    "198": "Reconciling every {0} seconds. Watching: {1}",
+    "199": "{0} changed. Applying {1} new lines.",
+    "200": "{0}: Preflight OK. PostgreSQL {1}; connect {2:.1f} ms; round trip {3:.1f} ms",
+    "201": "{0}: Preflight OK. Database does not exist yet and will be created from the template database.",
+    "202": "Preflight passed for {0} databases in {1:.2f} seconds.",
+    "203": "{0}: Table {1} ({2}) is logged. {3} of {4} tables done after {5:.1f} seconds.",
+    "204": "{0}: All tables are logged. Recorded LOGGING_MODE LOGGED in SYS_VARS.",
+    "205": "Finalizing {0} UNLOGGED tables in {1} databases.",
+    "206": "{0}: Column {1}.{2} uses collation {3}",
+    "207": "Planning capacity for {0} records: {1} features, {2} distinct features, {3} entities, {4} relationships.",
+    "208": "{0}: {1}: {2} rows of {3} bytes ({4}). Heap {5}, {6} indexes {7}. Initial load WAL {8}",
+    "209": "{0}: Heap {1}, indexes {2}, total {3}. Initial load WAL {4}. Hot indexes to keep cached {5}",
+    "210": "All databases: Heap {0}, indexes {1}, total {2}. Initial load WAL {3}. Hot indexes to keep cached {4}",
+    "211": "Wrote capacity plan to {0}",
+    "212": "{0}: {1}.{2}: {3} sampled values, {4} raw, {5} stored with {6} storage and {7} compression. Recompressed: {8}",
+    "213": "{0}: {1}.{2}: Table missing or column empty. Nothing to sample.",
     "293": "For information on warnings and errors, see https://github.com/senzing-garage/init-postgresql#errors",
     "294": "Version: {0}  Updated: {1}",
     "295": "Sleeping infinitely.",
@@ -264,6 +1048,21 @@ MESSAGE_DICTIONARY = {
     "298": "Exit {0}",
     "299": "{0}",
     "300": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
+    "301": "Could not create database {0} from template database {1}. Falling back to SQL file. Error: {2}",
+    "302": "Database {0} was created with index profile {1}. Ignoring SENZING_INDEX_PROFILE {2}.",
+    "303": "{0}: Session setting {1} for user {2} drifted. Found: {3}; Expected: {4}",
+    "304": "{0} changed, but removed lines cannot be undone. Ignoring: {1}",
+    "305": "{0}: Preflight round trip of {1:.1f} ms exceeds {2} ms. Initialization will be slow.",
+    "306": "{0}: Tables {1} are UNLOGGED and lose their data on a server crash. Run finalize after the initial load.",
+    "307": '{0}: Column {1}.{2} uses collation {3}, not "C". It existed before SENZING_C_COLLATION was set.',
+    "308": "{0}: lock_timeout on attempt {1} of {2}. Retrying in {3} seconds: {4}",
+    "309": "{0}: Blocked by pid {1}, user {2}, application '{3}', state {4}, lock {5}, transaction age {6}: {7}",
+    "310": "{0}: Could not sample row widths of {1}. Using widths from the SQL file. Error: {2}",
+    "311": "{0}: Server does not offer lz4 TOAST compression, which needs PostgreSQL 14 built with lz4. Setting storage strategies only.",
+    "312": "Schema {0} was created with index profile {1}, not SENZING_INDEX_PROFILE {2}. Skipping it.",
+    "313": "{0} is missing. Still watching for it.",
+    "314": "{0} changed, but changed lines cannot be reapplied. Ignoring: {1} -> {2}",
+    "315": "{0}: All tables are logged. There is no SYS_VARS table to record LOGGING_MODE in.",
     "499": "{0}",
     "500": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
     "568": "Original and new database URLs do not match. Original URL: {0}; Reconstructed URL: {1}",
@@ -274,6 +1073,27 @@ MESSAGE_DICTIONARY = {
     "700": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
     "701": "Missing required parameter: {0}",
     "702": "SQL.execute error: {0}",
+    "703": "Invalid tenant schema name: {0}",
+    "704": "Could not provision tenant schema {0}. Error: {1}",
+    "705": "SENZING_MAX_CONNECTIONS_PER_DATABASE must be at least 2. Value: {0}",
+    "706": "SENZING_TABLESPACE_MAP must be a JSON object of name patterns to tablespaces. Value: {0}",
+    "707": "SENZING_INDEX_PROFILE must be one of {0}. Value: {1}",
+    "708": "SENZING_SESSION_SETTINGS must be one of {0} or a JSON object of setting names to values. Value: {1}",
+    "709": "Cannot read Senzing configuration JSON from SENZING_CONFIGURATION_FILE {0}. Error: {1}",
+    "710": "There is no default Senzing configuration to export.",
+    "711": "{0} is zstd compressed, but the zstandard package is not installed.",
+    "712": "reset deletes all entity resolution data. To proceed, set SENZING_RESET_CONFIRMED or --confirm-reset.",
+    "713": "{0}: Could not reset database. Error: {1}",
+    "714": "Cannot read SENZING_CONFIGURATION_MODIFICATIONS_FILE {0}. Error: {1}",
+    "715": "{0}: Preflight failed. {1}",
+    "716": "Preflight failed for {0} of {1} databases. Nothing was changed.",
+    "717": "{0}: Could not set table {1} logged. Error: {2}",
+    "718": "SENZING_DDL_LOCK_TIMEOUT and SENZING_DDL_STATEMENT_TIMEOUT must be PostgreSQL durations like 500ms, 5s or 30min. Values: {0}, {1}",
+    "719": "SENZING_CAPACITY_RECORDS, SENZING_CAPACITY_FEATURES_PER_RECORD and SENZING_CAPACITY_DATA_SOURCES must be positive. Values: {0}, {1}, {2}",
+    "720": "SENZING_EVAL_QUEUE_LAYOUT must be one of {0}. Value: {1}",
+    "722": "Reconciling {0} failed, retrying at the next interval: {1}",
+    "723": "{0}: Stopped at SQL statement: {1} Error: {2}. Fix the cause and run again; SENZING_RESUME continues from this statement.",
+    "724": "Could not provision {0} of {1} tenant schemas: {2}. Their Senzing configuration was not created.",
     "730": "There are not enough safe characters to do the translation. Unsafe Characters: {0}; Safe Characters: {1}",
     "896": "Could not initialize G2ConfigMgr with '{0}'. Error: {1}",
     "897": "Could not initialize G2Config with '{0}'. Error: {1}",
@@ -389,7 +1209,16 @@ def get_configuration(subcommand, args):
 
     # Special case: Change boolean strings to booleans.
 
-    booleans = ["debug"]
+    booleans = [
+        "c_collation",
+        "column_compression",
+        "debug",
+        "reset_confirmed",
+        "resume",
+        "tablespace_move_existing",
+        "unlogged_tables",
+        "use_template_database",
+    ]
     for boolean in booleans:
         boolean_value = result.get(boolean)
         if isinstance(boolean_value, str):
@@ -401,7 +1230,21 @@ def get_configuration(subcommand, args):
 
     # Special case: Change integer strings to integers.
 
-    integers = ["sleep_time_in_seconds"]
+    integers = [
+        "capacity_data_sources",
+        "capacity_features_per_record",
+        "capacity_records",
+        "ddl_retries",
+        "loadtest_iterations",
+        "loadtest_threads",
+        "max_connections_per_database",
+        "reconcile_interval_in_seconds",
+        "sleep_time_in_seconds",
+        "tenant_threads",
+        "tune_loader_nodes",
+        "tune_loader_threads",
+        "tune_memory_in_gigabytes",
+    ]
     for integer in integers:
         integer_string = result.get(integer)
         result[integer] = int(integer_string)
@@ -414,6 +1257,69 @@ def get_configuration(subcommand, args):
     return result
 
 
+def get_setting_value_errors(config):
+    """Check the values of optional settings. Return a list of error messages."""
+
+    result = []
+
+    if not all(
+        SQL_DURATION_REGEX.match(str(config.get(name, "0")))
+        for name in ["ddl_lock_timeout", "ddl_statement_timeout"]
+    ):
+        result.append(
+            message_error(
+                718, config.get("ddl_lock_timeout"), config.get("ddl_statement_timeout")
+            )
+        )
+
+    if config.get("max_connections_per_database", 2) < 2:
+        result.append(message_error(705, config.get("max_connections_per_database")))
+
+    try:
+        get_tablespace_map(config)
+    except ValueError:
+        result.append(message_error(706, config.get("tablespace_map")))
+
+    index_profile = config.get("index_profile")
+    if index_profile and index_profile not in INDEX_PROFILES:
+        result.append(
+            message_error(707, ", ".join(INDEX_PROFILES.keys()), index_profile)
+        )
+
+    if config.get("eval_queue_layout", "default") not in EVAL_QUEUE_LAYOUTS:
+        result.append(
+            message_error(
+                720, ", ".join(EVAL_QUEUE_LAYOUTS), config.get("eval_queue_layout")
+            )
+        )
+
+    try:
+        get_session_settings(config)
+    except ValueError:
+        result.append(
+            message_error(
+                708,
+                ", ".join(SESSION_SETTINGS_PROFILES.keys()),
+                config.get("session_settings"),
+            )
+        )
+
+    try:
+        read_configuration_modifications(config)
+    except OSError as err:
+        result.append(
+            message_error(714, config.get("configuration_modifications_file"), err)
+        )
+
+    if config.get("configuration_file") and config.get("subcommand") != "config-export":
+        try:
+            read_configuration_file(config)
+        except (OSError, ValueError) as err:
+            result.append(message_error(709, config.get("configuration_file"), err))
+
+    return result
+
+
 def validate_configuration(config):
     """Check aggregate configuration from commandline options, environment variables, config files, and defaults."""
 
@@ -424,11 +1330,55 @@ def validate_configuration(config):
 
     subcommand = config.get("subcommand")
 
-    if subcommand in ["mandatory"]:
+    if subcommand in ["mandatory", "plan-capacity", "reconcile", "reset", "tenants"]:
 
         if not config.get("input_sql_url"):
             user_error_messages.append(message_error(701, "SENZING_INPUT_SQL_URL"))
 
+    user_error_messages.extend(get_setting_value_errors(config))
+
+    if subcommand in ["reset"]:
+
+        if not config.get("reset_confirmed"):
+            user_error_messages.append(message_error(712))
+
+    if subcommand in ["plan-capacity"]:
+
+        if (
+            min(
+                config.get("capacity_records"),
+                config.get("capacity_features_per_record"),
+                config.get("capacity_data_sources"),
+            )
+            < 1
+        ):
+            user_error_messages.append(
+                message_error(
+                    719,
+                    config.get("capacity_records"),
+                    config.get("capacity_features_per_record"),
+                    config.get("capacity_data_sources"),
+                )
+            )
+
+    if subcommand in ["config-export", "config-import"]:
+
+        if not config.get("configuration_file"):
+            user_error_messages.append(message_error(701, "SENZING_CONFIGURATION_FILE"))
+
+    if subcommand in [
+        "config-export",
+        "config-import",
+        "compression-report",
+        "finalize",
+        "loadtest",
+        "mandatory",
+        "preflight",
+        "reconcile",
+        "reset",
+        "tune",
+    ]:
+
         if not config.get("database_url") and not config.get(
             "engine_configuration_json"
         ):
@@ -439,6 +1389,18 @@ def validate_configuration(config):
                 )
             )
 
+    if subcommand in ["tenants"]:
+
+        if not config.get("database_url"):
+            user_error_messages.append(message_error(701, "SENZING_DATABASE_URL"))
+
+        if not config.get("tenant_schemas"):
+            user_error_messages.append(message_error(701, "SENZING_TENANT_SCHEMAS"))
+
+        for tenant_schema in get_tenant_schemas(config):
+            if not SQL_IDENTIFIER_REGEX.match(tenant_schema):
+                user_error_messages.append(message_error(703, tenant_schema))
+
     # Log warning messages.
 
     for user_warning_message in user_warning_messages:
@@ -541,9 +1503,12 @@ def exit_silently():
 class G2Initializer:
     """Perform steps to initialize Senzing."""
 
-    def __init__(self, g2_configuration_manager, g2_config):
+    def __init__(
+        self, g2_configuration_manager, g2_config, initial_configuration_json=None
+    ):
         self.g2_config = g2_config
         self.g2_configuration_manager = g2_configuration_manager
+        self.initial_configuration_json = initial_configuration_json
         self.senzing_command_functions = {
             "addDataSource": self.g2_config_add_data_source,
         }
@@ -571,20 +1536,9 @@ class G2Initializer:
             logging.info(message_info(171, default_config_id_bytearray.decode()))
             return None
 
-        # If there is no default configuration, create one in the 'configuration_bytearray' variable.
-
-        config_handle = self.g2_config.create()
-        configuration_bytearray = bytearray()
-        try:
-            self.g2_config.save(config_handle, configuration_bytearray)
-        except Exception as err:
-            raise Exception(
-                "G2Config.save({0}, {1}) failed".format(
-                    config_handle, configuration_bytearray
-                )
-            ) from err
+        # If there is no default configuration, create one.
 
-        self.g2_config.close(config_handle)
+        configuration_json = self.get_initial_configuration_json()
 
         # Save configuration JSON into G2 database.
 
@@ -592,12 +1546,12 @@ class G2Initializer:
         new_config_id = bytearray()
         try:
             self.g2_configuration_manager.addConfig(
-                configuration_bytearray.decode(), config_comment, new_config_id
+                configuration_json, config_comment, new_config_id
             )
         except Exception as err:
             raise Exception(
                 "G2ConfigMgr.addConfig({0}, {1}, {2}) failed".format(
-                    configuration_bytearray.decode(), config_comment, new_config_id
+                    configuration_json, config_comment, new_config_id
                 )
             ) from err
 
@@ -612,20 +1566,41 @@ class G2Initializer:
 
         return new_config_id
 
-    def g2_config_add_data_source(self, config_handle, parameters):
-        """Add a DATA_SOURCE."""
-        data_source_dictionary = {"DSRC_CODE": parameters}
-        data_source_json = json.dumps(data_source_dictionary)
-        response_bytearray = bytearray()
-        self.g2_config.addDataSource(
-            config_handle, data_source_json, response_bytearray
-        )
-        logging.info(message_info(172, parameters, response_bytearray.decode()))
+    def get_initial_configuration_json(self):
+        """Return the JSON of a new, default configuration. Created once per G2Initializer."""
 
-    def process_configuration_line(self, default_configuration_handle, line):
-        """Route a single command to the appropriate function."""
-        line_split = line.split()
-        command = line_split[0]
+        if self.initial_configuration_json:
+            return self.initial_configuration_json
+
+        config_handle = self.g2_config.create()
+        configuration_bytearray = bytearray()
+        try:
+            self.g2_config.save(config_handle, configuration_bytearray)
+        except Exception as err:
+            raise Exception(
+                "G2Config.save({0}, {1}) failed".format(
+                    config_handle, configuration_bytearray
+                )
+            ) from err
+
+        self.g2_config.close(config_handle)
+        self.initial_configuration_json = configuration_bytearray.decode()
+        return self.initial_configuration_json
+
+    def g2_config_add_data_source(self, config_handle, parameters):
+        """Add a DATA_SOURCE."""
+        data_source_dictionary = {"DSRC_CODE": parameters}
+        data_source_json = json.dumps(data_source_dictionary)
+        response_bytearray = bytearray()
+        self.g2_config.addDataSource(
+            config_handle, data_source_json, response_bytearray
+        )
+        logging.info(message_info(172, parameters, response_bytearray.decode()))
+
+    def process_configuration_line(self, default_configuration_handle, line):
+        """Route a single command to the appropriate function."""
+        line_split = line.split()
+        command = line_split[0]
         parameters = " ".join(line_split[1:])
         if command in self.senzing_command_functions.keys():
             self.senzing_command_functions[command](
@@ -646,12 +1621,9 @@ class G2Initializer:
 
         # Get default configuration as JSON string.
 
-        default_configuration_id_int = int(default_configuration_id_bytearray)
-        default_configuration_bytearray = bytearray()
-        self.g2_configuration_manager.getConfig(
-            default_configuration_id_int, default_configuration_bytearray
+        default_configuration_json = self.get_configuration_json(
+            default_configuration_id_bytearray
         )
-        default_configuration_json = default_configuration_bytearray.decode()
 
         # Create a G2Config object with the default configuration.
 
@@ -691,6 +1663,234 @@ class G2Initializer:
             )
         )
 
+    def get_configuration_json(self, configuration_id_bytearray):
+        """Return the JSON of a stored configuration."""
+
+        configuration_bytearray = bytearray()
+        self.g2_configuration_manager.getConfig(
+            int(configuration_id_bytearray.decode()), configuration_bytearray
+        )
+        return configuration_bytearray.decode()
+
+    def get_default_configuration(self):
+        """Return (configuration ID, JSON) of the default configuration, or (None, None)."""
+
+        default_configuration_id_bytearray = bytearray()
+        self.g2_configuration_manager.getDefaultConfigID(
+            default_configuration_id_bytearray
+        )
+        if not default_configuration_id_bytearray:
+            return None, None
+        return (
+            default_configuration_id_bytearray.decode(),
+            self.get_configuration_json(default_configuration_id_bytearray),
+        )
+
+    def import_configuration(self, configuration_json, configuration_comments):
+        """Add a configuration and make it the default, unless it already is.
+        Return the new configuration ID, or None if nothing changed."""
+
+        _, default_configuration_json = self.get_default_configuration()
+        if default_configuration_json and json.loads(
+            default_configuration_json
+        ) == json.loads(configuration_json):
+            return None
+
+        new_configuration_id_bytearray = bytearray()
+        self.g2_configuration_manager.addConfig(
+            configuration_json,
+            configuration_comments,
+            new_configuration_id_bytearray,
+        )
+        self.g2_configuration_manager.setDefaultConfigID(new_configuration_id_bytearray)
+        return new_configuration_id_bytearray.decode()
+
+
+# -----------------------------------------------------------------------------
+# Class: Tracer
+# -----------------------------------------------------------------------------
+
+
+class Tracer:
+    """Append one JSON line per traced SQL statement or G2 call. Thread-safe."""
+
+    def __init__(self, trace_file):
+        self.lock = threading.Lock()
+        self.trace_file = open(  # pylint: disable=consider-using-with
+            trace_file, "a", encoding="utf-8"
+        )
+
+    @contextlib.contextmanager
+    def trace(self, kind, operation, database):
+        """Time the enclosed block and record its outcome."""
+
+        start_time = time.time()
+        start_counter = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except Exception as err:
+            outcome = "{0}: {1}".format(type(err).__name__, " ".join(str(err).split()))
+            raise
+        finally:
+            record = {
+                "start": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(start_time))
+                + ".{0:06d}Z".format(int(start_time % 1 * 1000000)),
+                "duration_ms": round((time.perf_counter() - start_counter) * 1000, 3),
+                "kind": kind,
+                "operation": operation,
+                "database": database,
+                "outcome": outcome,
+                "thread": threading.current_thread().name,
+            }
+            with self.lock:
+                self.trace_file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        """Flush and close the trace file."""
+
+        with self.lock:
+            self.trace_file.close()
+
+
+class TracingCursor(extensions.cursor):
+    """A psycopg2 cursor that traces every execute when tracing is enabled."""
+
+    def execute(self, query, vars=None):  # pylint: disable=redefined-builtin
+        """Execute, recording the statement, its duration and its outcome."""
+
+        if not TRACER_SINGLETON:
+            return super().execute(query, vars)
+        operation = (
+            query.as_string(self) if isinstance(query, sql.Composable) else query
+        )
+        database = "{0}:{1}/{2}".format(
+            self.connection.info.host,
+            self.connection.info.port,
+            self.connection.info.dbname,
+        )
+        with TRACER_SINGLETON.trace("sql", operation, database):
+            return super().execute(query, vars)
+
+
+class TracedG2ConfigMgr:
+    """Wrap a G2ConfigMgr so the calls that reach the database are traced."""
+
+    traced_methods = [
+        "addConfig",
+        "getConfig",
+        "getDefaultConfigID",
+        "setDefaultConfigID",
+    ]
+
+    def __init__(self, g2_configuration_manager, database):
+        self.g2_configuration_manager = g2_configuration_manager
+        self.database = database
+
+    def __getattr__(self, name):
+        attribute = getattr(self.g2_configuration_manager, name)
+        if name not in self.traced_methods:
+            return attribute
+
+        def traced_method(*args, **kwargs):
+            with TRACER_SINGLETON.trace(
+                "g2", "G2ConfigMgr.{0}".format(name), self.database
+            ):
+                return attribute(*args, **kwargs)
+
+        return traced_method
+
+
+# -----------------------------------------------------------------------------
+# Class: DatabaseConnectionManager
+# -----------------------------------------------------------------------------
+
+
+class DatabaseConnectionManager:
+    """Thread-safe pools of reusable psycopg2 connections. One pool per distinct database."""
+
+    def __init__(self, max_connections_per_database):
+        self.max_connections_per_database = max_connections_per_database
+        self.lock = threading.Lock()
+        self.idle_connections = {}
+        self.semaphores = {}
+
+    @staticmethod
+    def get_key(db_parameters):
+        """Distinct connection parameters get distinct pools."""
+        return json.dumps(db_parameters, sort_keys=True)
+
+    @contextlib.contextmanager
+    def connection(self, db_parameters, connect_timeout=None):
+        """Borrow an autocommit connection. It is returned to the pool on exit.
+        connect_timeout, in seconds, bounds opening a new connection."""
+
+        key = self.get_key(db_parameters)
+        with self.lock:
+            semaphore = self.semaphores.setdefault(
+                key, threading.BoundedSemaphore(self.max_connections_per_database)
+            )
+            idle_connections = self.idle_connections.setdefault(key, [])
+
+        semaphore.acquire()
+        db_connection = None
+        try:
+            with self.lock:
+                if idle_connections:
+                    db_connection = idle_connections.pop()
+            if db_connection is None or db_connection.closed:
+                connect_parameters = dict(db_parameters)
+                if connect_timeout:
+                    connect_parameters["connect_timeout"] = connect_timeout
+                db_connection = psycopg2.connect(
+                    cursor_factory=TracingCursor, **connect_parameters
+                )
+                db_connection.autocommit = True
+            yield db_connection
+        finally:
+            if db_connection is not None:
+                self.release(key, db_connection)
+            semaphore.release()
+
+    def release(self, key, db_connection):
+        """Reset a connection and keep it, unless it is broken."""
+
+        if not db_connection.closed:
+            try:
+                if (
+                    db_connection.info.transaction_status
+                    == extensions.TRANSACTION_STATUS_IDLE
+                ):
+                    db_connection.reset()
+                    db_connection.autocommit = True
+                    with self.lock:
+                        if key in self.idle_connections:
+                            self.idle_connections[key].append(db_connection)
+                            return
+            except psycopg2.Error:
+                pass
+            db_connection.close()
+
+    def close(self, db_parameters):
+        """Close the idle connections to one database."""
+
+        with self.lock:
+            idle_connections = self.idle_connections.pop(
+                self.get_key(db_parameters), []
+            )
+        for db_connection in idle_connections:
+            db_connection.close()
+
+    def close_all(self):
+        """Close the idle connections to all databases."""
+
+        with self.lock:
+            idle_connections_lists = list(self.idle_connections.values())
+            self.idle_connections.clear()
+        for idle_connections in idle_connections_lists:
+            for db_connection in idle_connections:
+                db_connection.close()
+
 
 # -----------------------------------------------------------------------------
 # Database URL parsing
@@ -729,6 +1929,17 @@ def get_safe_characters(a_string):
 
 
 def parse_database_url(original_senzing_database_url):
+    """Given a canonical database URL, decompose into URL components. Results are cached."""
+
+    result = PARSED_DATABASE_URL_CACHE.get(original_senzing_database_url)
+    if result is None:
+        result = parse_database_url_uncached(original_senzing_database_url)
+        if result:
+            PARSED_DATABASE_URL_CACHE[original_senzing_database_url] = result
+    return dict(result)
+
+
+def parse_database_url_uncached(original_senzing_database_url):
     """Given a canonical database URL, decompose into URL components."""
 
     result = {}
@@ -813,12 +2024,15 @@ def parse_database_url(original_senzing_database_url):
 # -----------------------------------------------------------------------------
 
 
-def create_senzing_database_connection_string(database_url):
+def create_senzing_database_connection_string(database_url, schema=None):
     """Transform PostgreSQL URL to a format Senzing understands."""
     parsed_database_url = parse_database_url(database_url)
-    return "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/".format(
+    result = "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/".format(
         **parsed_database_url
     )
+    if schema:
+        result = "{0}?schema={1}".format(result, schema)
+    return result
 
 
 def get_db_parameters(database_url):
@@ -842,154 +2056,349 @@ def get_db_parameters(database_url):
     return result
 
 
-def process_sql_file(input_url, db_parameters):
-    """Read an SQL file line-by-line and do a database execute on each line."""
+def get_sql_compression_format(input_url, input_file):
+    """Return the compression format of an SQL input, or None if it is plain text.
+    The URL's extension decides; otherwise the leading magic bytes are peeked."""
 
-    db_connection = psycopg2.connect(**db_parameters)
-    db_connection.autocommit = True
+    path = urlparse(input_url).path.lower()
+    for compression_format, details in SQL_COMPRESSION_FORMATS.items():
+        if any(path.endswith(extension) for extension in details.get("extensions")):
+            return compression_format
+
+    leading_bytes = input_file.peek(8)
+    for compression_format, details in SQL_COMPRESSION_FORMATS.items():
+        if leading_bytes.startswith(details.get("magic")):
+            return compression_format
+    return None
+
+
+def open_sql_input(input_url, input_file):
+    """Wrap a binary stream so it yields decompressed lines. Decompression is incremental."""
+
+    input_file = io.BufferedReader(input_file)
+    compression_format = get_sql_compression_format(input_url, input_file)
+    if compression_format == "bz2":
+        return bz2.BZ2File(input_file)
+    if compression_format == "gzip":
+        return gzip.GzipFile(fileobj=input_file)
+    if compression_format == "xz":
+        return lzma.LZMAFile(input_file)
+    if compression_format == "zstd":
+        if not zstandard:
+            exit_error(711, input_url)
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(input_file))
+    return input_file
+
+
+def read_sql_statements(input_url):
+    """Read an SQL file line-by-line and yield each non-empty line.
+    gzip, bz2, xz and zstd compressed files are decompressed as they stream."""
 
     if input_url:
         with urllib.request.urlopen(input_url) as input_file:
-            for line in input_file:
+            for line in open_sql_input(input_url, input_file):
                 line_string = line.decode("utf-8").strip()
                 if line_string:
-                    try:
-                        db_cursor = db_connection.cursor()
-                        db_cursor.execute(line_string)
-                        db_cursor.close()
-                    except (Exception, psycopg2.DatabaseError) as error:
-                        err_message = " ".join(str(error).split())
-                        logging.error(message_error(702, err_message))
+                    yield line_string
 
-    if db_connection is not None:
-        db_connection.close()
 
+def execute_sql_statements(db_connection, sql_statements, sql_context=None):
+    """Do a database execute on each SQL statement. Errors are logged, not raised.
+    Statements run with the DDL lock and statement timeouts of the sql_context.
+    With a journal_phase, each statement commits together with its journal entry,
+    statements finished by a previous run are skipped, and any error other than one
+    about something that already exists stops the run with an exception that names
+    the statement, so the run can be resumed.
+    """
 
-def create_database_url(a_string, old_value, new_value, occurrence):
-    """Replace the last instance of a character to form a proper URL."""
+    sql_context = sql_context or {}
+    journal_phase = sql_context.get("journal_phase")
+    finished_steps = set()
+    if journal_phase:
+        finished_steps = get_finished_steps(db_connection, journal_phase)
+    skipped = 0
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute(
+        "SELECT set_config('lock_timeout', %s, false), set_config('statement_timeout', %s, false)",
+        (
+            str(sql_context.get("ddl_lock_timeout", "0")),
+            str(sql_context.get("ddl_statement_timeout", "0")),
+        ),
+    )
+    db_cursor.close()
 
-    split_list = a_string.rsplit(old_value, occurrence)
-    return new_value.join(split_list)
+    for sql_statement in sql_statements:
+        if get_journal_step_hash(sql_statement) in finished_steps:
+            skipped += 1
+            continue
+        try:
+            execute_sql_statement_with_retry(db_connection, sql_statement, sql_context)
+        except (Exception, psycopg2.DatabaseError) as error:
+            err_message = " ".join(str(error).split())
+            logging.error(message_error(702, err_message))
+            if journal_phase and (
+                getattr(error, "pgcode", None) not in SQL_ALREADY_EXISTS_SQLSTATES
+            ):
+                raise Exception(sql_statement) from error
 
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("RESET lock_timeout; RESET statement_timeout")
+    db_cursor.close()
 
-# -----------------------------------------------------------------------------
-# Senzing services.
-# -----------------------------------------------------------------------------
+    if skipped:
+        logging.info(message_info(192, db_connection.info.dbname, skipped))
 
 
-def get_g2_configuration_dictionary(config):
-    """Construct a dictionary in the form of the old ini files."""
+def execute_sql_statement(db_connection, sql_statement, journal_phase=None):
+    """Execute one SQL statement. With a journal_phase, journal it in the same transaction."""
 
-    result = {
-        "PIPELINE": {
-            "CONFIGPATH": config.get("etc_dir"),
-            "RESOURCEPATH": "{0}/resources".format(config.get("g2_dir")),
-            "SUPPORTPATH": config.get("data_dir"),
-        },
-        "SQL": {
-            "BACKEND": "SQL",
-            "CONNECTION": create_senzing_database_connection_string(
-                config.get("database_url")
-            ),
-        },
-    }
-    return result
+    db_cursor = db_connection.cursor()
+    try:
+        if journal_phase:
+            db_cursor.execute("BEGIN")
+            db_cursor.execute(sql_statement)
+            mark_step_finished(db_cursor, journal_phase, sql_statement)
+            db_cursor.execute("COMMIT")
+        else:
+            db_cursor.execute(sql_statement)
+    except psycopg2.DatabaseError:
+        if journal_phase and not db_connection.closed:
+            with contextlib.suppress(psycopg2.Error):
+                db_connection.cursor().execute("ROLLBACK")
+        raise
+    finally:
+        db_cursor.close()
+
+
+def execute_sql_statement_with_retry(db_connection, sql_statement, sql_context):
+    """Execute one SQL statement. On lock_timeout, report the blocking sessions and
+    retry with exponential backoff, up to SENZING_DDL_RETRIES times."""
+
+    ddl_retries = sql_context.get("ddl_retries", 0)
+    for attempt in range(ddl_retries + 1):
+        try:
+            execute_sql_statement(
+                db_connection, sql_statement, sql_context.get("journal_phase")
+            )
+            return
+        except psycopg2.OperationalError as error:
+            if error.pgcode != errorcodes.LOCK_NOT_AVAILABLE or attempt >= ddl_retries:
+                raise
+            backoff = min(
+                DDL_RETRY_BACKOFF_IN_SECONDS * 2**attempt,
+                DDL_RETRY_MAX_BACKOFF_IN_SECONDS,
+            )
+            logging.warning(
+                message_warning(
+                    308,
+                    db_connection.info.dbname,
+                    attempt + 1,
+                    ddl_retries + 1,
+                    backoff,
+                    sql_statement[:100],
+                )
+            )
+            for blocking_session in get_blocking_sessions(db_connection, sql_statement):
+                logging.warning(
+                    message_warning(309, db_connection.info.dbname, *blocking_session)
+                )
+            time.sleep(backoff)
 
 
-def get_g2_configuration_json(config):
-    """Return a JSON string with Senzing configuration."""
-    result = ""
-    if config.get("engine_configuration_json"):
-        result = config.get("engine_configuration_json")
-    else:
-        result = json.dumps(get_g2_configuration_dictionary(config))
+def get_blocking_sessions(db_connection, sql_statement):
+    """Sessions holding locks on the relation an SQL statement needs.
+    The lock wait has ended, so holders of the relation's locks stand in for blockers.
+    """
+
+    match = SQL_STATEMENT_RELATION_REGEX.match(sql_statement)
+    if not match:
+        return []
+    db_cursor = db_connection.cursor()
+    db_cursor.execute(
+        "SELECT a.pid, a.usename, a.application_name, a.state, l.mode, date_trunc('second', now() - a.xact_start), left(regexp_replace(a.query, '\\s+', ' ', 'g'), 200) FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid WHERE l.relation = to_regclass(%s) AND l.granted AND l.pid <> pg_backend_pid() ORDER BY a.xact_start",
+        (match.group(1),),
+    )
+    result = db_cursor.fetchall()
+    db_cursor.close()
     return result
 
 
-# -----------------------------------------------------------------------------
-# Senzing services.
-# -----------------------------------------------------------------------------
+def process_sql_file(input_url, db_parameters, config=None):
+    """Read an SQL file line-by-line and do a database execute on each line."""
 
+    config = config or {}
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        sql_context = get_sql_context(config, db_connection)
+        execute_sql_statements(
+            db_connection,
+            transform_sql_statements(read_sql_statements(input_url), sql_context),
+            sql_context,
+        )
+        record_sql_context(db_connection, sql_context)
+        if sql_context.get("c_collation"):
+            report_key_column_collations(db_connection)
+        if config.get("tablespace_move_existing"):
+            move_relations_to_tablespaces(db_connection, sql_context)
 
-def get_g2_config(config, g2_config_name="init-container-G2-config"):
-    """Get the G2Config resource."""
-    global G2_CONFIG_SINGLETON
 
-    if G2_CONFIG_SINGLETON:
-        return G2_CONFIG_SINGLETON
+def get_tenant_schemas(config):
+    """Expand SENZING_TENANT_SCHEMAS into an ordered list of unique schema names."""
 
-    try:
-        g2_configuration_json = get_g2_configuration_json(config)
-        result = G2Config()
-        result.init(g2_config_name, g2_configuration_json, config.get("debug"))
-    except G2Exception as err:
-        exit_error(897, g2_configuration_json, err)
+    result = []
+    tenant_schemas = config.get("tenant_schemas") or ""
+    for tenant_schema in tenant_schemas.split(","):
+        tenant_schema = tenant_schema.strip()
+        if not tenant_schema:
+            continue
+        match = TENANT_SCHEMA_RANGE_REGEX.search(tenant_schema)
+        if not match:
+            result.append(tenant_schema)
+            continue
+        start, stop = match.group(1), match.group(2)
+        width = len(start) if start.startswith("0") else 0
+        for number in range(int(start), int(stop) + 1):
+            result.append(
+                "{0}{1}{2}".format(
+                    tenant_schema[: match.start()],
+                    str(number).zfill(width),
+                    tenant_schema[match.end() :],
+                )
+            )
+    return list(dict.fromkeys(result))
 
-    G2_CONFIG_SINGLETON = result
-    return result
 
+def provision_tenant_schema(db_parameters, tenant_schema, sql_statements, sql_context):
+    """Create a tenant schema, if missing, and run the SQL statements in it.
+    Return False if the tenant schema could not be provisioned."""
 
-def get_g2_configuration_manager(
-    config, g2_configuration_manager_name="init-container-G2-configuration-manager"
+    try:
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            if provision_tenant_schema_on_connection(
+                db_connection,
+                tenant_schema,
+                sql_statements,
+                sql_context,
+            ):
+                record_sql_context(db_connection, sql_context)
+                if sql_context.get("c_collation"):
+                    report_key_column_collations(db_connection, tenant_schema)
+    except (Exception, psycopg2.DatabaseError) as err:
+        logging.error(message_error(704, tenant_schema, " ".join(str(err).split())))
+        return False
+    return True
+
+
+def provision_tenant_schema_on_connection(
+    db_connection, tenant_schema, sql_statements, sql_context=None
 ):
-    """Get the G2ConfigMgr resource."""
-    global G2_CONFIGURATION_MANAGER_SINGLETON
+    """Create a tenant schema, if missing, and run the SQL statements in it.
+    search_path is restored when the connection is returned to the pool.
+    Return False if the schema exists with a different index profile."""
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("SELECT 1 FROM pg_namespace WHERE nspname = %s", (tenant_schema,))
+    if not db_cursor.fetchone():
+        db_cursor.execute(
+            sql.SQL("CREATE SCHEMA IF NOT EXISTS {0}").format(
+                sql.Identifier(tenant_schema)
+            )
+        )
+        logging.info(message_info(174, tenant_schema))
+    db_cursor.execute(
+        sql.SQL("SET search_path TO {0}").format(sql.Identifier(tenant_schema))
+    )
+    db_cursor.close()
 
-    if G2_CONFIGURATION_MANAGER_SINGLETON:
-        return G2_CONFIGURATION_MANAGER_SINGLETON
+    # The SQL statements were transformed once for all tenants.
+    # An existing schema keeps the index profile it was created with.
 
-    try:
-        g2_configuration_json = get_g2_configuration_json(config)
-        result = G2ConfigMgr()
-        result.init(
-            g2_configuration_manager_name, g2_configuration_json, config.get("debug")
+    index_profile = (sql_context or {}).get("index_profile", "default")
+    recorded_index_profile = get_recorded_index_profile(db_connection)
+    if recorded_index_profile not in [None, index_profile]:
+        logging.warning(
+            message_warning(312, tenant_schema, recorded_index_profile, index_profile)
         )
-    except G2Exception as err:
-        exit_error(896, g2_configuration_json, err)
+        return False
+    execute_sql_statements(db_connection, sql_statements, sql_context)
+    return True
+
+
+@contextlib.contextmanager
+def database_advisory_lock(db_parameters):
+    """Hold the init-postgresql advisory lock on a database.
+    Yield True if another instance held the lock and this one had to wait."""
+
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        db_cursor = db_connection.cursor()
+        db_cursor.execute("SELECT pg_try_advisory_lock(%s)", (ADVISORY_LOCK_KEY,))
+        waited = not db_cursor.fetchone()[0]
+        if waited:
+            logging.info(message_info(179, db_parameters.get("dbname")))
+            db_cursor.execute("SELECT pg_advisory_lock(%s)", (ADVISORY_LOCK_KEY,))
+        try:
+            yield waited
+        finally:
+            db_cursor.execute("SELECT pg_advisory_unlock(%s)", (ADVISORY_LOCK_KEY,))
+            db_cursor.close()
 
-    G2_CONFIGURATION_MANAGER_SINGLETON = result
-    return result
 
+def is_database_initialized(db_parameters):
+    """Return True if the Senzing schema has been created in the database."""
 
-# -----------------------------------------------------------------------------
-# tasks
-#   Common function signature: task_XXX(config)
-# -----------------------------------------------------------------------------
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        return is_schema_initialized(db_connection)
 
 
-def task_modify_senzing_configuration(config):
-    """Insert Senzing configuration into the database."""
+def is_schema_initialized(db_connection):
+    """Return True if the Senzing schema has been created in the current schema."""
 
-    configuration_modifications = config.get("configuration_modifications")
+    db_cursor = db_connection.cursor()
+    db_cursor.execute(
+        "SELECT to_regclass('sys_vars') IS NOT NULL AND to_regclass('ix_eval_queue') IS NOT NULL"
+    )
+    result = db_cursor.fetchone()[0]
+    if result:
+        db_cursor.execute(
+            "SELECT 1 FROM sys_vars WHERE var_group = 'VERSION' AND var_code = 'SCHEMA'"
+        )
+        result = db_cursor.fetchone() is not None
+    db_cursor.close()
+    return result
 
-    if configuration_modifications is None:
-        return
 
-    # Get Senzing resources.
+def create_database_url(a_string, old_value, new_value, occurrence):
+    """Replace the last instance of a character to form a proper URL."""
 
-    g2_config = get_g2_config(config)
-    g2_configuration_manager = get_g2_configuration_manager(config)
+    split_list = a_string.rsplit(old_value, occurrence)
+    return new_value.join(split_list)
 
-    # Modify G2 configuration.
 
-    g2_initializer = G2Initializer(g2_configuration_manager, g2_config)
-    try:
-        g2_initializer.process_configuration_modifications(configuration_modifications)
-    except Exception as err:
-        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+def get_main_database_url(config):
+    """Return the URL of the database holding the Senzing configuration."""
 
+    result = config.get("database_url")
+    engine_configuration_json = config.get("engine_configuration_json")
+    if engine_configuration_json:
+        engine_configuration = json.loads(engine_configuration_json)
+        db_url_raw = engine_configuration.get("SQL", {}).get("CONNECTION")
+        if db_url_raw:
+            result = create_database_url(db_url_raw, ":", "/", 1)
+    return result
 
-def task_process_sql_file(config):
-    """Process a file of SQL statements."""
 
-    input_url = config.get("input_sql_url")
-    db_parameters_list = []
+def get_database_urls(config):
+    """Return the unique list of database URLs to be initialized."""
+
+    result = []
 
     # If set, include CLI/Environment single database URL.
 
     database_url = config.get("database_url")
     if database_url:
-        db_parameters_list.append(database_url)
+        result.append(database_url)
 
     # If set, include database URLs listed in SENZING_ENGINE_CONFIGURATION_JSON.
 
@@ -999,7 +2408,7 @@ def task_process_sql_file(config):
 
         db_url_raw = engine_configuration.get("SQL", {}).get("CONNECTION")
         if db_url_raw:
-            db_parameters_list.append(create_database_url(db_url_raw, ":", "/", 1))
+            result.append(create_database_url(db_url_raw, ":", "/", 1))
 
         cluster_key = engine_configuration.get("SQL", {}).get("BACKEND")
         if cluster_key:
@@ -1012,68 +2421,2803 @@ def task_process_sql_file(config):
                     cluster_values.append(value)
                 cluster_values_set = set(cluster_values)
 
-                for cluster_value in cluster_values_set:
+                for cluster_value in sorted(cluster_values_set):
                     cluster_db_raw = engine_configuration.get(cluster_value, {}).get(
                         "DB_1"
                     )
-                    db_parameters_list.append(
-                        create_database_url(cluster_db_raw, ":", "/", 1)
-                    )
+                    result.append(create_database_url(cluster_db_raw, ":", "/", 1))
 
-    # Run the input SQL file against all databases.
-
-    db_parameters_set = set(db_parameters_list)
-    for db_parameters in db_parameters_set:
-        process_sql_file(input_url, get_db_parameters(db_parameters))
+    return list(dict.fromkeys(result))
 
 
-def task_update_senzing_configuration(config):
-    """Insert Senzing configuration into the database."""
+def get_table_database_url(config, table_name):
+    """Return the URL of the database holding a table. Cluster backends map tables to clusters."""
 
-    # Get Senzing resources.
+    result = get_main_database_url(config)
+    engine_configuration_json = config.get("engine_configuration_json")
+    if engine_configuration_json:
+        engine_configuration = json.loads(engine_configuration_json)
+        cluster_key = engine_configuration.get("SQL", {}).get("BACKEND")
+        if cluster_key and cluster_key != "SQL":
+            cluster_value = engine_configuration.get(cluster_key, {}).get(table_name)
+            cluster_db_raw = engine_configuration.get(cluster_value, {}).get("DB_1")
+            if cluster_db_raw:
+                result = create_database_url(cluster_db_raw, ":", "/", 1)
+    return result
 
-    g2_config = get_g2_config(config)
-    g2_configuration_manager = get_g2_configuration_manager(config)
 
-    # Initialize G2 database.
+def replace_database_in_url(database_url, database_name):
+    """Return database_url pointing at a different database on the same server."""
 
-    g2_initializer = G2Initializer(g2_configuration_manager, g2_config)
-    try:
-        default_config_id = g2_initializer.create_default_config_id()
-        if default_config_id:
-            logging.info(message_info(170, default_config_id.decode()))
-    except Exception as err:
-        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+    parsed_database_url = parse_database_url(database_url)
+    url_parts = [
+        parsed_database_url.get("scheme"),
+        parsed_database_url.get("netloc"),
+        "/{0}".format(database_name),
+        parsed_database_url.get("params"),
+        parsed_database_url.get("query"),
+        parsed_database_url.get("fragment"),
+    ]
+    return urlunparse(url_parts)
 
 
 # -----------------------------------------------------------------------------
-# do_* functions
-#   Common function signature: do_XXX(args)
+# SQL statement transforms
+#   Common function signature: transform_XXX(sql_statement, sql_context)
+#   Each returns a list of SQL statements to execute in place of sql_statement.
 # -----------------------------------------------------------------------------
 
 
-def do_docker_acceptance_test(subcommand, args):
-    """For use with Docker acceptance testing."""
+def append_sql_clause(sql_statement, clause):
+    """Append a clause to a statement, keeping the trailing semicolon."""
 
-    # Get context from CLI, environment variables, and ini files.
+    statement = sql_statement.rstrip().rstrip(";").rstrip()
+    return "{0} {1} ;".format(statement, clause)
 
-    config = get_configuration(subcommand, args)
 
-    # Prolog.
+def match_name_pattern(name_patterns, name):
+    """Return the value of the first pattern that matches name, case-insensitively."""
 
-    logging.info(entry_template(config))
+    for pattern, value in name_patterns.items():
+        if fnmatch.fnmatchcase(name.upper(), pattern.upper()):
+            return value
+    return None
 
-    # Epilog.
 
-    logging.info(exit_template(config))
+def get_tablespace_map(config):
+    """Return SENZING_TABLESPACE_MAP as a dictionary. Raise ValueError if malformed."""
 
+    tablespace_map = config.get("tablespace_map") or {}
+    if isinstance(tablespace_map, str):
+        tablespace_map = json.loads(tablespace_map)
+    if not isinstance(tablespace_map, dict):
+        raise ValueError(tablespace_map)
+    for tablespace in tablespace_map.values():
+        if not SQL_IDENTIFIER_REGEX.match(str(tablespace)):
+            raise ValueError(tablespace)
+    return tablespace_map
 
-def do_mandatory(subcommand, args):
-    """Do a task."""
 
-    # Get context from CLI, environment variables, and ini files.
+def get_sys_var(db_connection, var_code):
+    """Return a value init-postgresql recorded in SYS_VARS, or None."""
 
-    config = get_configuration(subcommand, args)
+    result = None
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("SELECT to_regclass('sys_vars') IS NOT NULL")
+    if db_cursor.fetchone()[0]:
+        db_cursor.execute(
+            "SELECT var_value FROM sys_vars WHERE var_group = %s AND var_code = %s",
+            (SYS_VARS_GROUP, var_code),
+        )
+        row = db_cursor.fetchone()
+        if row:
+            result = row[0]
+    db_cursor.close()
+    return result
+
+
+def set_sys_var(db_connection, var_code, var_value):
+    """Record a value in SYS_VARS. Return False if there is no SYS_VARS table."""
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("SELECT to_regclass('sys_vars') IS NOT NULL")
+    if not db_cursor.fetchone()[0]:
+        db_cursor.close()
+        return False
+    db_cursor.execute(
+        """
+        INSERT INTO sys_vars (var_group, var_code, var_value, sys_lstupd_dt)
+        VALUES (%s, %s, %s, now())
+        ON CONFLICT (var_group, var_code)
+        DO UPDATE SET var_value = EXCLUDED.var_value, sys_lstupd_dt = EXCLUDED.sys_lstupd_dt
+        """,
+        (SYS_VARS_GROUP, var_code, var_value),
+    )
+    db_cursor.close()
+    return True
+
+
+def get_recorded_index_profile(db_connection):
+    """The index profile an existing schema was created with, or None for a new schema.
+    A schema created before profiles were recorded has the stock indexes."""
+
+    result = get_sys_var(db_connection, "INDEX_PROFILE")
+    if not result and is_schema_initialized(db_connection):
+        result = "default"
+    return result
+
+
+def get_index_profile(config, db_connection):
+    """The index profile of an existing schema wins, so indexes stay consistent across runs."""
+
+    requested_index_profile = config.get("index_profile")
+    recorded_index_profile = None
+    if db_connection:
+        recorded_index_profile = get_recorded_index_profile(db_connection)
+    if recorded_index_profile:
+        if requested_index_profile not in [None, recorded_index_profile]:
+            logging.warning(
+                message_warning(
+                    302,
+                    db_connection.info.dbname,
+                    recorded_index_profile,
+                    requested_index_profile,
+                )
+            )
+        return recorded_index_profile
+    return requested_index_profile or "default"
+
+
+def get_sql_context(config, db_connection=None):
+    """Per-database values used by the SQL statement transforms.
+    Without a db_connection, only the configuration is considered."""
+
+    return {
+        "index_profile": get_index_profile(config, db_connection),
+        "journal_phase": "SQL" if config.get("resume") else None,
+        "tablespace_map": get_tablespace_map(config),
+        "c_collation": config.get("c_collation"),
+        "column_compression": get_column_compression(config, db_connection),
+        "ddl_lock_timeout": config.get("ddl_lock_timeout", "0"),
+        "ddl_retries": config.get("ddl_retries", 0),
+        "ddl_statement_timeout": config.get("ddl_statement_timeout", "0"),
+        "eval_queue_layout": config.get("eval_queue_layout", "default"),
+        "unlogged_tables": UNLOGGED_TABLES if config.get("unlogged_tables") else [],
+    }
+
+
+def record_sql_context(db_connection, sql_context):
+    """After the SQL file has run, record choices that later runs must honor."""
+
+    try:
+        set_sys_var(db_connection, "INDEX_PROFILE", sql_context.get("index_profile"))
+        if sql_context.get("unlogged_tables"):
+            db_cursor = db_connection.cursor()
+            logging_mode = "UNLOGGED" if get_unlogged_tables(db_cursor) else "LOGGED"
+            db_cursor.close()
+            set_sys_var(db_connection, "LOGGING_MODE", logging_mode)
+    except psycopg2.DatabaseError as error:
+        logging.error(message_error(702, " ".join(str(error).split())))
+
+
+def get_sql_statement_transforms():
+    """Transforms in the order they are applied. Tablespaces go last, as TABLESPACE ends the clauses."""
+
+    return [
+        transform_index_profile,
+        transform_eval_queue_layout,
+        transform_c_collation,
+        transform_unlogged,
+        transform_column_compression,
+        transform_tablespace,
+    ]
+
+
+def transform_sql_statements(sql_statements, sql_context):
+    """Yield SQL statements after applying each transform."""
+
+    transforms = get_sql_statement_transforms()
+    for sql_statement in sql_statements:
+        result = [sql_statement]
+        for transform in transforms:
+            result = [
+                new_statement
+                for statement in result
+                for new_statement in transform(statement, sql_context)
+            ]
+        yield from result
+
+
+def transform_index_profile(sql_statement, sql_context):
+    """Replace stock CREATE INDEX statements and add indexes per SENZING_INDEX_PROFILE."""
+
+    index_profile = INDEX_PROFILES.get(sql_context.get("index_profile"), {})
+    if not index_profile:
+        return [sql_statement]
+
+    match = SQL_CREATE_INDEX_REGEX.match(sql_statement)
+    if match:
+        index_name = match.group(2).upper()
+        return [index_profile.get("replace").get(index_name, sql_statement)]
+
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if match:
+        table_name = match.group(1).upper()
+        return [sql_statement] + index_profile.get("add").get(table_name, [])
+
+    return [sql_statement]
+
+
+def transform_eval_queue_layout(sql_statement, sql_context):
+    """Create SYS_EVAL_QUEUE per SENZING_EVAL_QUEUE_LAYOUT."""
+
+    eval_queue_layout = sql_context.get("eval_queue_layout", "default")
+    if eval_queue_layout == "default":
+        return [sql_statement]
+
+    match = SQL_CREATE_INDEX_REGEX.match(sql_statement)
+    if match and match.group(2).upper() == "IX_EVAL_QUEUE":
+        return [
+            append_sql_clause(
+                sql_statement, "WITH ({0})".format(EVAL_QUEUE_INDEX_STORAGE_PARAMETERS)
+            )
+        ]
+
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if not match or match.group(1).upper() != "SYS_EVAL_QUEUE":
+        return [sql_statement]
+
+    return [
+        append_sql_clause(
+            SQL_EVAL_QUEUE_KEY_REGEX.sub("MSG_ID BIGSERIAL PRIMARY KEY", sql_statement),
+            "WITH ({0})".format(EVAL_QUEUE_STORAGE_PARAMETERS),
+        )
+    ]
+
+
+def transform_c_collation(sql_statement, sql_context):
+    """Give hash and key columns COLLATE "C" per SENZING_C_COLLATION. Indexes inherit it."""
+
+    if not sql_context.get("c_collation"):
+        return [sql_statement]
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if not match:
+        return [sql_statement]
+    return [SQL_C_COLLATION_COLUMN_REGEX.sub(r'\1 \2 COLLATE "C"', sql_statement)]
+
+
+def get_key_column_collations(db_cursor):
+    """Verification query: (table, column, collation) of hash and key columns in the current schema."""
+
+    db_cursor.execute(
+        "SELECT c.relname, a.attname, CASE WHEN co.collname = 'default' THEN 'default (' || d.datcollate || ')' ELSE co.collname END FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_collation co ON co.oid = a.attcollation JOIN pg_database d ON d.datname = current_database() WHERE c.relnamespace = current_schema()::regnamespace AND c.relkind IN ('r', 'p') AND upper(a.attname) = ANY(%s) AND NOT a.attisdropped ORDER BY c.relname, a.attname",
+        (C_COLLATION_COLUMNS,),
+    )
+    return db_cursor.fetchall()
+
+
+def report_key_column_collations(db_connection, location=None):
+    """Log the collation of each hash and key column in the current schema.
+    Flag any that is not "C". location defaults to the database name."""
+
+    location = location or db_connection.info.dbname
+    db_cursor = db_connection.cursor()
+    for table_name, column_name, collation in get_key_column_collations(db_cursor):
+        if collation == "C":
+            logging.info(
+                message_info(206, location, table_name, column_name, collation)
+            )
+        else:
+            logging.warning(
+                message_warning(307, location, table_name, column_name, collation)
+            )
+    db_cursor.close()
+
+
+def transform_unlogged(sql_statement, sql_context):
+    """Create the write-heavy tables UNLOGGED per SENZING_UNLOGGED_TABLES."""
+
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if match and match.group(1).upper() in sql_context.get("unlogged_tables", []):
+        return [
+            re.sub(
+                r"^CREATE\s+TABLE\b",
+                "CREATE UNLOGGED TABLE",
+                sql_statement,
+                flags=re.IGNORECASE,
+            )
+        ]
+    return [sql_statement]
+
+
+def get_unlogged_tables(db_cursor):
+    """Return the names of UNLOGGED tables in the current schema."""
+
+    db_cursor.execute(
+        "SELECT c.relname FROM pg_class c WHERE c.relnamespace = current_schema()::regnamespace AND c.relkind = 'r' AND c.relpersistence = 'u' ORDER BY c.relname"
+    )
+    return [row[0] for row in db_cursor.fetchall()]
+
+
+def set_table_logged(db_parameters, table_name):
+    """ALTER TABLE ... SET LOGGED. This rewrites the table and its indexes into the WAL."""
+
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        db_cursor = db_connection.cursor()
+        db_cursor.execute(
+            "SELECT pg_size_pretty(pg_total_relation_size(%s::regclass))",
+            (table_name,),
+        )
+        table_size = db_cursor.fetchone()[0]
+        db_cursor.execute(
+            sql.SQL("ALTER TABLE {0} SET LOGGED").format(sql.Identifier(table_name))
+        )
+        db_cursor.close()
+    return table_size
+
+
+def is_lz4_supported(db_connection):
+    """True if the server can compress TOAST values with lz4."""
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute(
+        "SELECT 'lz4' = ANY(enumvals) FROM pg_settings WHERE name = 'default_toast_compression'"
+    )
+    row = db_cursor.fetchone()
+    db_cursor.close()
+    return bool(row and row[0])
+
+
+def get_column_compression(config, db_connection):
+    """Compression method for SENZING_COLUMN_COMPRESSION: lz4 where supported, else pglz.
+    Without a db_connection, lz4 is assumed."""
+
+    if not config.get("column_compression"):
+        return None
+    if not db_connection or is_lz4_supported(db_connection):
+        return "lz4"
+    logging.warning(message_warning(311, db_connection.info.dbname))
+    return "pglz"
+
+
+def transform_column_compression(sql_statement, sql_context):
+    """Set storage strategy and compression of large TEXT columns per SENZING_COLUMN_COMPRESSION.
+    pglz is the server default, so only lz4 is set explicitly."""
+
+    column_compression = sql_context.get("column_compression")
+    if not column_compression:
+        return [sql_statement]
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if not match or match.group(1).upper() not in COMPRESSED_COLUMNS:
+        return [sql_statement]
+
+    clauses = []
+    for column_name, storage in COMPRESSED_COLUMNS.get(match.group(1).upper()).items():
+        clauses.append("ALTER COLUMN {0} SET STORAGE {1}".format(column_name, storage))
+        if column_compression == "lz4":
+            clauses.append("ALTER COLUMN {0} SET COMPRESSION lz4".format(column_name))
+    return [
+        sql_statement,
+        "ALTER TABLE {0} {1} ;".format(match.group(1), ", ".join(clauses)),
+    ]
+
+
+def transform_tablespace(sql_statement, sql_context):
+    """Place tables, primary keys (<TABLE>_PKEY) and indexes per SENZING_TABLESPACE_MAP."""
+
+    tablespace_map = sql_context.get("tablespace_map")
+    if not tablespace_map:
+        return [sql_statement]
+
+    match = SQL_CREATE_TABLE_REGEX.match(sql_statement)
+    if match:
+        table_name = match.group(1)
+        primary_key_tablespace = match_name_pattern(
+            tablespace_map, "{0}_PKEY".format(table_name)
+        )
+        if primary_key_tablespace:
+            sql_statement = SQL_PRIMARY_KEY_REGEX.sub(
+                lambda primary_key: "{0} USING INDEX TABLESPACE {1}".format(
+                    primary_key.group(0), primary_key_tablespace
+                ),
+                sql_statement,
+                count=1,
+            )
+        table_tablespace = match_name_pattern(tablespace_map, table_name)
+        if table_tablespace:
+            sql_statement = append_sql_clause(
+                sql_statement, "TABLESPACE {0}".format(table_tablespace)
+            )
+        return [sql_statement]
+
+    match = SQL_CREATE_INDEX_REGEX.match(sql_statement)
+    if match:
+        index_tablespace = match_name_pattern(tablespace_map, match.group(2))
+        if index_tablespace:
+            sql_statement = append_sql_clause(
+                sql_statement, "TABLESPACE {0}".format(index_tablespace)
+            )
+    return [sql_statement]
+
+
+def move_relations_to_tablespaces(db_connection, sql_context):
+    """Move existing tables and indexes whose tablespace differs from SENZING_TABLESPACE_MAP."""
+
+    tablespace_map = sql_context.get("tablespace_map")
+    if not tablespace_map:
+        return
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("""
+        SELECT c.relname, c.relkind, COALESCE(t.spcname, dt.spcname)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_tablespace t ON t.oid = c.reltablespace
+        JOIN pg_database d ON d.datname = current_database()
+        JOIN pg_tablespace dt ON dt.oid = d.dattablespace
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'i')
+        ORDER BY c.relname
+        """)
+    for relation_name, relation_kind, current_tablespace in db_cursor.fetchall():
+        tablespace = match_name_pattern(tablespace_map, relation_name)
+        if not tablespace or tablespace == current_tablespace:
+            continue
+        alter = "ALTER TABLE {0} SET TABLESPACE {1}"
+        if relation_kind == "i":
+            alter = "ALTER INDEX {0} SET TABLESPACE {1}"
+        try:
+            db_cursor.execute(
+                sql.SQL(alter).format(
+                    sql.Identifier(relation_name), sql.Identifier(tablespace)
+                )
+            )
+            logging.info(message_info(181, relation_name, tablespace))
+        except psycopg2.DatabaseError as error:
+            logging.error(message_error(702, " ".join(str(error).split())))
+    db_cursor.close()
+
+
+# -----------------------------------------------------------------------------
+# Progress journal
+# -----------------------------------------------------------------------------
+
+
+def get_journal_step_hash(step):
+    """Identify a step, such as an SQL statement, by its content."""
+
+    return hashlib.sha256(step.encode()).hexdigest()
+
+
+def get_finished_steps(db_connection, phase):
+    """Create the journal, if needed, and return the hashes of finished steps in a phase."""
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute(JOURNAL_TABLE_DDL)
+    db_cursor.execute(
+        "SELECT STEP_HASH FROM INIT_POSTGRESQL_JOURNAL WHERE PHASE = %s", (phase,)
+    )
+    result = {row[0] for row in db_cursor.fetchall()}
+    db_cursor.close()
+    return result
+
+
+def mark_step_finished(db_cursor, phase, step):
+    """Journal a step as finished. Runs in the caller's transaction."""
+
+    db_cursor.execute(
+        "INSERT INTO INIT_POSTGRESQL_JOURNAL (PHASE, STEP_HASH, STEP) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+        (phase, get_journal_step_hash(step), step[:250]),
+    )
+
+
+def get_unfinished_steps(db_parameters, phase, steps):
+    """Return the steps that the journal of a database does not record as finished, in order."""
+
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        finished_steps = get_finished_steps(db_connection, phase)
+    return [step for step in steps if get_journal_step_hash(step) not in finished_steps]
+
+
+def record_steps_finished(db_parameters, phase, steps):
+    """Journal steps as finished in one transaction."""
+
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        db_cursor = db_connection.cursor()
+        db_cursor.execute("BEGIN")
+        for step in steps:
+            mark_step_finished(db_cursor, phase, step)
+        db_cursor.execute("COMMIT")
+        db_cursor.close()
+
+
+# -----------------------------------------------------------------------------
+# Template databases
+# -----------------------------------------------------------------------------
+
+
+def get_template_database_name(config, initial_configuration_json):
+    """Template name is versioned by a hash of the transformed SQL file and initial Senzing configuration."""
+
+    template_hash = hashlib.sha256()
+    for sql_statement in transform_sql_statements(
+        read_sql_statements(config.get("input_sql_url")), get_sql_context(config)
+    ):
+        template_hash.update(sql_statement.encode("utf-8"))
+        template_hash.update(b"\n")
+    template_hash.update(initial_configuration_json.encode("utf-8"))
+    template_hash.update((config.get("configuration_modifications") or "").encode())
+    return "{0}{1}".format(TEMPLATE_DATABASE_PREFIX, template_hash.hexdigest()[:16])
+
+
+def get_maintenance_db_parameters(database_url):
+    """Parameters for connecting to the server's maintenance database."""
+
+    result = get_db_parameters(database_url)
+    result.pop("options", None)
+    result["dbname"] = MAINTENANCE_DATABASE
+    return result
+
+
+def database_exists(db_cursor, database_name):
+    """Return (exists, is_template) for a database."""
+
+    db_cursor.execute(
+        "SELECT datistemplate FROM pg_database WHERE datname = %s", (database_name,)
+    )
+    row = db_cursor.fetchone()
+    if row is None:
+        return False, False
+    return True, row[0]
+
+
+def create_template_database(
+    config, db_cursor, database_url, template_name, initial_configuration_json
+):
+    """Create and fully initialize a template database. Stale templates are dropped."""
+
+    template_url = replace_database_in_url(database_url, template_name)
+
+    # A template that exists but is not marked as a template was left half-built.
+
+    exists, is_template = database_exists(db_cursor, template_name)
+    if exists and is_template:
+        return
+    if exists:
+        db_cursor.execute(
+            sql.SQL("DROP DATABASE {0}").format(sql.Identifier(template_name))
+        )
+    db_cursor.execute(
+        sql.SQL("CREATE DATABASE {0}").format(sql.Identifier(template_name))
+    )
+
+    # Schema and initial Senzing configuration.
+
+    process_sql_file(
+        config.get("input_sql_url"), get_db_parameters(template_url), config
+    )
+    update_senzing_configuration(
+        config,
+        json.dumps(
+            get_g2_configuration_dictionary(dict(config, database_url=template_url))
+        ),
+        "init-container-G2-configuration-manager-{0}".format(template_name),
+        get_db_parameters(template_url),
+        initial_configuration_json,
+    )
+
+    # Nobody may connect to a template, otherwise CREATE DATABASE ... TEMPLATE fails.
+
+    get_database_connection_manager().close(get_db_parameters(template_url))
+
+    db_cursor.execute(
+        sql.SQL(
+            "ALTER DATABASE {0} WITH IS_TEMPLATE true ALLOW_CONNECTIONS false"
+        ).format(sql.Identifier(template_name))
+    )
+    logging.info(message_info(176, template_name))
+
+    # Remove older versions of the template.
+
+    db_cursor.execute(
+        "SELECT datname FROM pg_database WHERE datname LIKE %s AND datname <> %s",
+        ("{0}%".format(TEMPLATE_DATABASE_PREFIX), template_name),
+    )
+    for (stale_template_name,) in db_cursor.fetchall():
+        db_cursor.execute(
+            sql.SQL("ALTER DATABASE {0} WITH IS_TEMPLATE false").format(
+                sql.Identifier(stale_template_name)
+            )
+        )
+        db_cursor.execute(
+            sql.SQL("DROP DATABASE {0}").format(sql.Identifier(stale_template_name))
+        )
+        logging.info(message_info(178, stale_template_name))
+
+
+def clone_template_database(
+    config, database_url, template_name, initial_configuration_json
+):
+    """Create a missing database from the template. Return True if it was cloned."""
+
+    # Template databases are server-wide, so concurrent instances are serialized
+    # on the maintenance database. A database that appeared while waiting was
+    # created by another instance.
+
+    maintenance_db_parameters = get_maintenance_db_parameters(database_url)
+    with database_advisory_lock(maintenance_db_parameters) as waited:
+        with get_database_connection_manager().connection(
+            maintenance_db_parameters
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            try:
+                exists, _ = database_exists(
+                    db_cursor, get_db_parameters(database_url).get("dbname")
+                )
+                if exists:
+                    return waited
+                return clone_template_database_on_cursor(
+                    config,
+                    db_cursor,
+                    database_url,
+                    template_name,
+                    initial_configuration_json,
+                )
+            finally:
+                db_cursor.close()
+
+
+def clone_template_database_on_cursor(
+    config, db_cursor, database_url, template_name, initial_configuration_json
+):
+    """Create a database from the template. Return True if it was cloned."""
+
+    database_name = get_db_parameters(database_url).get("dbname")
+    try:
+        create_template_database(
+            config, db_cursor, database_url, template_name, initial_configuration_json
+        )
+        db_cursor.execute(
+            sql.SQL("CREATE DATABASE {0} TEMPLATE {1}").format(
+                sql.Identifier(database_name), sql.Identifier(template_name)
+            )
+        )
+        logging.info(message_info(177, database_name, template_name))
+        return True
+    except (Exception, psycopg2.DatabaseError) as err:
+        logging.warning(
+            message_warning(
+                301, database_name, template_name, " ".join(str(err).split())
+            )
+        )
+
+    # Fallback: an empty database that the SQL file will be applied to.
+
+    exists, _ = database_exists(db_cursor, database_name)
+    if not exists:
+        db_cursor.execute(
+            sql.SQL("CREATE DATABASE {0}").format(sql.Identifier(database_name))
+        )
+    return False
+
+
+# -----------------------------------------------------------------------------
+# Session settings
+# -----------------------------------------------------------------------------
+
+
+def get_session_settings(config):
+    """Return SENZING_SESSION_SETTINGS as a dictionary. Raise ValueError if malformed."""
+
+    session_settings = config.get("session_settings") or {}
+    if isinstance(session_settings, str):
+        if session_settings in SESSION_SETTINGS_PROFILES:
+            session_settings = SESSION_SETTINGS_PROFILES.get(session_settings)
+        else:
+            session_settings = json.loads(session_settings)
+    if not isinstance(session_settings, dict):
+        raise ValueError(session_settings)
+    for name in session_settings.keys():
+        if not SESSION_SETTING_NAME_REGEX.match(name):
+            raise ValueError(name)
+    return {name: str(value) for name, value in session_settings.items()}
+
+
+def get_role_database_settings(db_cursor):
+    """Return settings pinned for the current user in the current database."""
+
+    db_cursor.execute("""
+        SELECT unnest(s.setconfig)
+        FROM pg_db_role_setting s
+        JOIN pg_roles r ON r.oid = s.setrole
+        JOIN pg_database d ON d.oid = s.setdatabase
+        WHERE r.rolname = current_user AND d.datname = current_database()
+        """)
+    result = {}
+    for (setting,) in db_cursor.fetchall():
+        name, _, value = setting.partition("=")
+        result[name] = value
+    return result
+
+
+def apply_session_settings(db_connection, session_settings):
+    """Pin session settings for the current user in the current database. Report drift."""
+
+    database_name = db_connection.info.dbname
+    user = db_connection.info.user
+    db_cursor = db_connection.cursor()
+    current_settings = get_role_database_settings(db_cursor)
+
+    changes = 0
+    for name, value in session_settings.items():
+        current_value = current_settings.get(name)
+        if current_value == value:
+            continue
+        if current_settings:
+            logging.warning(
+                message_warning(303, database_name, name, user, current_value, value)
+            )
+        try:
+            db_cursor.execute(
+                sql.SQL("ALTER ROLE {0} IN DATABASE {1} SET {2} = %s").format(
+                    sql.Identifier(user), sql.Identifier(database_name), sql.SQL(name)
+                ),
+                (value,),
+            )
+            logging.info(message_info(188, database_name, name, value, user))
+            changes += 1
+        except psycopg2.DatabaseError as error:
+            logging.error(message_error(702, " ".join(str(error).split())))
+
+    if not changes:
+        logging.info(message_info(189, database_name, user))
+    db_cursor.close()
+
+
+# -----------------------------------------------------------------------------
+# Preflight
+# -----------------------------------------------------------------------------
+
+
+def get_engine_configuration_problems(config):
+    """Check SENZING_ENGINE_CONFIGURATION_JSON, including cluster sections, without connecting."""
+
+    result = []
+    engine_configuration_json = config.get("engine_configuration_json")
+    if not engine_configuration_json:
+        return result
+    try:
+        engine_configuration = json.loads(engine_configuration_json)
+    except ValueError as err:
+        return ["SENZING_ENGINE_CONFIGURATION_JSON is not JSON: {0}".format(err)]
+
+    database_entries = {
+        "SQL.CONNECTION": engine_configuration.get("SQL", {}).get("CONNECTION")
+    }
+    cluster_key = engine_configuration.get("SQL", {}).get("BACKEND")
+    if cluster_key and cluster_key != "SQL":
+        cluster = engine_configuration.get(cluster_key)
+        if not isinstance(cluster, dict):
+            return ["SQL.BACKEND names a missing section: {0}".format(cluster_key)]
+        for cluster_value in sorted(set(cluster.values())):
+            database_entries["{0}.DB_1".format(cluster_value)] = (
+                engine_configuration.get(cluster_value, {}).get("DB_1")
+            )
+
+    for name, db_url_raw in database_entries.items():
+        if not db_url_raw:
+            result.append("{0} is missing.".format(name))
+            continue
+        try:
+            db_parameters = get_db_parameters(
+                create_database_url(db_url_raw, ":", "/", 1)
+            )
+        except Exception as err:
+            result.append("{0} cannot be parsed: {1}".format(name, err))
+            continue
+        if not db_parameters.get("host") or not db_parameters.get("dbname"):
+            result.append("{0} needs a host and a database.".format(name))
+    return result
+
+
+def is_missing_database(error, db_parameters):
+    """Return True if a connection failed because the database does not exist.
+    libpq connection errors seldom carry a SQLSTATE, so pg_database is asked too."""
+
+    if error.pgcode == errorcodes.INVALID_CATALOG_NAME:
+        return True
+    maintenance_db_parameters = dict(db_parameters, dbname=MAINTENANCE_DATABASE)
+    maintenance_db_parameters.pop("options", None)
+    try:
+        with get_database_connection_manager().connection(
+            maintenance_db_parameters,
+            connect_timeout=PREFLIGHT_CONNECT_TIMEOUT_IN_SECONDS,
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            db_cursor.execute(
+                "SELECT 1 FROM pg_database WHERE datname = %s",
+                (db_parameters.get("dbname"),),
+            )
+            result = db_cursor.fetchone() is None
+            db_cursor.close()
+    except psycopg2.OperationalError:
+        return False
+    return result
+
+
+def preflight_missing_database(config, db_parameters):
+    """A database that does not exist is fine if it will be cloned from the template."""
+
+    if not config.get("use_template_database"):
+        return ["Database does not exist."]
+    maintenance_db_parameters = dict(db_parameters, dbname=MAINTENANCE_DATABASE)
+    maintenance_db_parameters.pop("options", None)
+    with get_database_connection_manager().connection(
+        maintenance_db_parameters, connect_timeout=PREFLIGHT_CONNECT_TIMEOUT_IN_SECONDS
+    ) as db_connection:
+        db_cursor = db_connection.cursor()
+        db_cursor.execute(
+            "SELECT rolcreatedb OR rolsuper FROM pg_roles WHERE rolname = current_user"
+        )
+        if not db_cursor.fetchone()[0]:
+            return ["Database does not exist and the user may not create databases."]
+    return []
+
+
+def preflight_database(config, db_parameters):
+    """Check one database. Return (problems, details)."""
+
+    problems = []
+    with contextlib.ExitStack() as exit_stack:
+        start_time = time.perf_counter()
+        try:
+            db_connection = exit_stack.enter_context(
+                get_database_connection_manager().connection(
+                    db_parameters, connect_timeout=PREFLIGHT_CONNECT_TIMEOUT_IN_SECONDS
+                )
+            )
+        except psycopg2.OperationalError as err:
+            if is_missing_database(err, db_parameters):
+                return preflight_missing_database(config, db_parameters), None
+            return ["Cannot connect: {0}".format(" ".join(str(err).split()))], None
+        details = {"connect_ms": (time.perf_counter() - start_time) * 1000}
+
+        db_cursor = db_connection.cursor()
+
+        round_trips = []
+        for _ in range(PREFLIGHT_ROUND_TRIPS):
+            start_time = time.perf_counter()
+            db_cursor.execute("SELECT 1")
+            db_cursor.fetchone()
+            round_trips.append((time.perf_counter() - start_time) * 1000)
+        details["round_trip_ms"] = sorted(round_trips)[len(round_trips) // 2]
+
+        db_cursor.execute(
+            "SELECT current_setting('server_version'), current_setting('server_version_num')::int, has_schema_privilege(current_schema(), 'CREATE'), has_database_privilege(current_database(), 'CREATE'), current_schema()"
+        )
+        (
+            details["server_version"],
+            server_version_num,
+            can_create_in_schema,
+            can_create_schema,
+            current_schema,
+        ) = db_cursor.fetchone()
+
+        if server_version_num < PREFLIGHT_MINIMUM_SERVER_VERSION_NUM:
+            problems.append(
+                "PostgreSQL {0} is older than the minimum, {1}.".format(
+                    details["server_version"], PREFLIGHT_MINIMUM_SERVER_VERSION_NUM
+                )
+            )
+        # Tenants get schemas of their own, so only the database privilege matters.
+        # Since PostgreSQL 15, ordinary users may not create in the public schema.
+
+        if config.get("subcommand") == "tenants":
+            if not can_create_schema:
+                problems.append(
+                    "No CREATE privilege on the database to create schemas."
+                )
+        elif current_schema is None:
+            problems.append("No schema in search_path exists.")
+        elif not can_create_in_schema:
+            problems.append("No CREATE privilege on schema {0}.".format(current_schema))
+
+        if current_schema:
+            details["unlogged_tables"] = get_unlogged_tables(db_cursor)
+
+        for tablespace in sorted(set(get_tablespace_map(config).values())):
+            db_cursor.execute(
+                "SELECT has_tablespace_privilege(oid, 'CREATE') FROM pg_tablespace WHERE spcname = %s",
+                (tablespace,),
+            )
+            row = db_cursor.fetchone()
+            if not row:
+                problems.append("Tablespace {0} does not exist.".format(tablespace))
+            elif not row[0]:
+                problems.append(
+                    "No CREATE privilege on tablespace {0}.".format(tablespace)
+                )
+        db_cursor.close()
+    return problems, details
+
+
+def get_preflight_databases(config):
+    """Unique databases to check, by connection parameters. Tenants share one database."""
+
+    result = {}
+    for database_url in get_database_urls(config):
+        db_parameters = get_db_parameters(database_url)
+        if config.get("subcommand") == "tenants":
+            db_parameters.pop("options", None)
+        result.setdefault(
+            DatabaseConnectionManager.get_key(db_parameters), db_parameters
+        )
+    return list(result.values())
+
+
+# -----------------------------------------------------------------------------
+# Reconcile
+# -----------------------------------------------------------------------------
+
+
+def get_local_path(url_or_path):
+    """Return the local path of a file:// URL or plain path. None for remote URLs."""
+
+    parsed_url = urlparse(url_or_path or "")
+    if parsed_url.scheme == "file":
+        return unquote(parsed_url.path)
+    if not parsed_url.scheme:
+        return url_or_path
+    return None
+
+
+def get_file_signature(path):
+    """Cheap change detection: modification time and size."""
+
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def read_configuration_modifications(config):
+    """Return modifications from SENZING_CONFIGURATION_MODIFICATIONS_FILE, if set,
+    otherwise from SENZING_CONFIGURATION_MODIFICATIONS."""
+
+    configuration_modifications_file = config.get("configuration_modifications_file")
+    if not configuration_modifications_file:
+        return config.get("configuration_modifications")
+    with open(configuration_modifications_file, "r", encoding="utf-8") as input_file:
+        return input_file.read()
+
+
+def get_line_changes(old_lines, new_lines):
+    """Return (added lines, (old, new) pairs of changed lines, removed lines), in file order.
+    Blank lines and lines that only moved are ignored."""
+
+    old_line_set = set(old_lines)
+    new_line_set = set(new_lines)
+    added_lines = []
+    changed_lines = []
+    removed_lines = []
+    sequence_matcher = difflib.SequenceMatcher(
+        None, old_lines, new_lines, autojunk=False
+    )
+    for tag, old_start, old_end, new_start, new_end in sequence_matcher.get_opcodes():
+        old_block = old_lines[old_start:old_end]
+        new_block = new_lines[new_start:new_end]
+        if tag == "replace":
+            changed_lines.extend(zip(old_block, new_block))
+            added_lines.extend(new_block[len(old_block) :])
+            removed_lines.extend(old_block[len(new_block) :])
+        elif tag == "insert":
+            added_lines.extend(new_block)
+        elif tag == "delete":
+            removed_lines.extend(old_block)
+
+    # A pair with a line that also appears elsewhere is a move, not a change.
+
+    for old_line, new_line in list(changed_lines):
+        if old_line in new_line_set or new_line in old_line_set:
+            changed_lines.remove((old_line, new_line))
+            added_lines.append(new_line)
+            removed_lines.append(old_line)
+    added_lines = [
+        line for line in added_lines if line.strip() and line not in old_line_set
+    ]
+    changed_lines = [
+        (old_line, new_line)
+        for old_line, new_line in changed_lines
+        if old_line.strip() and new_line.strip()
+    ]
+    removed_lines = [
+        line for line in removed_lines if line.strip() and line not in new_line_set
+    ]
+    return added_lines, changed_lines, removed_lines
+
+
+def reconcile_sql_statements(config, sql_statements):
+    """Run new SQL statements against every database."""
+
+    for database_url in get_database_urls(config):
+        db_parameters = get_db_parameters(database_url)
+        with database_advisory_lock(db_parameters):
+            with get_database_connection_manager().connection(
+                db_parameters
+            ) as db_connection:
+                sql_context = get_sql_context(config, db_connection)
+                execute_sql_statements(
+                    db_connection,
+                    transform_sql_statements(sql_statements, sql_context),
+                    sql_context,
+                )
+
+
+def reconcile_configuration_modifications(config, configuration_modifications):
+    """Apply new configuration modifications with the warm G2 singletons."""
+
+    db_parameters = get_db_parameters(get_main_database_url(config))
+    g2_initializer = G2Initializer(
+        get_g2_configuration_manager(config), get_g2_config(config)
+    )
+    with database_advisory_lock(db_parameters):
+        try:
+            apply_configuration_modifications(
+                g2_initializer, db_parameters, configuration_modifications
+            )
+        except Exception as err:
+            logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+
+
+# -----------------------------------------------------------------------------
+# Reset
+# -----------------------------------------------------------------------------
+
+
+def get_reset_tables(db_cursor):
+    """Return the entity resolution tables in the current schema."""
+
+    db_cursor.execute(
+        "SELECT tablename FROM pg_tables WHERE schemaname = current_schema() ORDER BY tablename"
+    )
+    return [
+        table_name
+        for (table_name,) in db_cursor.fetchall()
+        if any(
+            fnmatch.fnmatch(table_name.upper(), pattern)
+            for pattern in RESET_TABLE_PATTERNS
+        )
+    ]
+
+
+def reset_database(db_parameters, sys_sequence_statements):
+    """Empty the entity resolution tables, restart their identity sequences,
+    and reseed SYS_SEQUENCE in one transaction."""
+
+    start_time = time.time()
+    with database_advisory_lock(db_parameters):
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            reset_tables = get_reset_tables(db_cursor)
+            db_cursor.execute("BEGIN")
+            try:
+                if reset_tables:
+                    db_cursor.execute(
+                        sql.SQL("TRUNCATE {0} RESTART IDENTITY").format(
+                            sql.SQL(", ").join(map(sql.Identifier, reset_tables))
+                        )
+                    )
+                db_cursor.execute("DELETE FROM SYS_SEQUENCE")
+                for sys_sequence_statement in sys_sequence_statements:
+                    db_cursor.execute(sys_sequence_statement)
+                db_cursor.execute("COMMIT")
+            except psycopg2.DatabaseError:
+                db_cursor.execute("ROLLBACK")
+                raise
+            finally:
+                db_cursor.close()
+    logging.info(
+        message_info(
+            197,
+            db_parameters.get("dbname"),
+            len(reset_tables),
+            len(sys_sequence_statements),
+            time.time() - start_time,
+        )
+    )
+
+
+# -----------------------------------------------------------------------------
+# Load test
+#   Common function signature: loadtest_XXX(db_cursors, row_id)
+#   db_cursors maps each table of the pattern to a cursor on the database holding it.
+#   Load test rows have negative identifiers so they can be removed afterwards.
+# -----------------------------------------------------------------------------
+
+
+def loadtest_lib_feat(db_cursors, row_id):
+    """A new feature: LIB_FEAT plus its hash key."""
+
+    feat_hash = hashlib.sha1("loadtest-{0}".format(row_id).encode()).hexdigest()
+    db_cursors.get("LIB_FEAT").execute(
+        "INSERT INTO LIB_FEAT (LIB_FEAT_ID, FTYPE_ID, FEAT_HASH, FEAT_DESC, FELEM_VALUES, ANONYMIZED, VERSION) VALUES (%s, -1, %s, 'LOADTEST', '{\"LOADTEST\": true}', 'No', 1)",
+        (row_id, feat_hash),
+    )
+    db_cursors.get("LIB_FEAT_HKEY").execute(
+        "INSERT INTO LIB_FEAT_HKEY (FEAT_HASH, FTYPE_ID, ANONYMIZED, LIB_FEAT_ID) VALUES (%s, -1, 'No', %s)",
+        (feat_hash, row_id),
+    )
+
+
+def loadtest_obs_ent(db_cursors, row_id):
+    """A new observed entity: OBS_ENT plus its source key."""
+
+    ent_src_key = "LOADTEST-{0}".format(row_id)
+    db_cursors.get("OBS_ENT").execute(
+        "INSERT INTO OBS_ENT (OBS_ENT_ID, ETYPE_ID, DSRC_ID, ENT_SRC_KEY, LOCKING_ID, NODE_NAME, FEATURES) VALUES (%s, -1, -1, %s, 0, 'init-postgresql-loadtest', '{}')",
+        (row_id, ent_src_key),
+    )
+    db_cursors.get("OBS_ENT_SKEY").execute(
+        "INSERT INTO OBS_ENT_SKEY (ENT_SRC_KEY, ETYPE_ID, DSRC_ID, OBS_ENT_ID) VALUES (%s, -1, -1, %s)",
+        (ent_src_key, row_id),
+    )
+
+
+def loadtest_res_ent_okey(db_cursors, row_id):
+    """Re-resolve an observed entity into another resolved entity."""
+
+    db_cursors.get("RES_ENT_OKEY").execute(
+        "UPDATE RES_ENT_OKEY SET RES_ENT_ID = RES_ENT_ID - 1, ER_ID = ER_ID + 1, MATCH_KEY = '+NAME+DOB' WHERE OBS_ENT_ID = %s AND LENS_ID = 1",
+        (row_id,),
+    )
+
+
+def loadtest_sys_sequence(db_cursors, row_id):  # pylint: disable=unused-argument
+    """Reserve a block of identifiers. All threads contend on one row, like the engine."""
+
+    db_cursor = db_cursors.get("SYS_SEQUENCE")
+    db_cursor.execute(
+        "UPDATE SYS_SEQUENCE SET NEXT_SEQUENCE = NEXT_SEQUENCE + CACHE_SIZE WHERE SEQUENCE_NAME = %s RETURNING NEXT_SEQUENCE",
+        (LOADTEST_SEQUENCE_NAME,),
+    )
+    db_cursor.fetchone()
+
+
+def prepare_loadtest(config):
+    """Remove leftovers of earlier load tests and create the rows the updates need."""
+
+    cleanup_loadtest(config)
+    rows = config.get("loadtest_threads") * config.get("loadtest_iterations")
+    statements = {
+        "RES_ENT_OKEY": (
+            "INSERT INTO RES_ENT_OKEY (OBS_ENT_ID, LENS_ID, RES_ENT_ID, ER_ID, ERRULE_ID) SELECT -g, 1, -g, 0, 0 FROM generate_series(1, %s) g",
+            (rows,),
+        ),
+        "SYS_SEQUENCE": (
+            "INSERT INTO SYS_SEQUENCE (SEQUENCE_NAME, NEXT_SEQUENCE, CACHE_SIZE, SCATTER) VALUES (%s, 1, 1000, 'N')",
+            (LOADTEST_SEQUENCE_NAME,),
+        ),
+    }
+    for table_name, (statement, parameters) in statements.items():
+        with get_database_connection_manager().connection(
+            get_db_parameters(get_table_database_url(config, table_name))
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            db_cursor.execute(statement, parameters)
+            db_cursor.close()
+
+
+def cleanup_loadtest(config):
+    """Delete every row the load test created, each table in the database holding it."""
+
+    for table_name, statement in LOADTEST_CLEANUP_STATEMENTS.items():
+        with get_database_connection_manager().connection(
+            get_db_parameters(get_table_database_url(config, table_name))
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            db_cursor.execute(statement)
+            db_cursor.close()
+
+
+def run_loadtest_worker(table_db_parameters, operation, first_row_id, iterations):
+    """Run one operation repeatedly, one transaction per database each time.
+    table_db_parameters maps each table to its database. Return (latencies, errors)."""
+
+    latencies = []
+    errors = 0
+    with contextlib.ExitStack() as exit_stack:
+
+        # Tables in the same database share a connection.
+
+        db_connections = {}
+        db_cursors = {}
+        for table_name, db_parameters in table_db_parameters.items():
+            key = DatabaseConnectionManager.get_key(db_parameters)
+            if key not in db_connections:
+                db_connections[key] = exit_stack.enter_context(
+                    get_database_connection_manager().connection(db_parameters)
+                )
+                db_connections[key].autocommit = False
+            db_cursors[table_name] = db_connections[key].cursor()
+
+        for iteration in range(iterations):
+            row_id = -(first_row_id + iteration)
+            start_time = time.perf_counter()
+            try:
+                operation(db_cursors, row_id)
+                for db_connection in db_connections.values():
+                    db_connection.commit()
+                latencies.append(time.perf_counter() - start_time)
+            except psycopg2.DatabaseError as error:
+                for db_connection in db_connections.values():
+                    db_connection.rollback()
+                errors += 1
+                logging.debug(message_debug(999, error))
+        for db_cursor in db_cursors.values():
+            db_cursor.close()
+    return latencies, errors
+
+
+def get_percentile(sorted_values, percentile):
+    """Nearest-rank percentile of an already sorted list."""
+
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(percentile / 100 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def run_loadtest_pattern(config, pattern_name, operation):
+    """Run one write pattern on all threads and log throughput and latency percentiles."""
+
+    threads = config.get("loadtest_threads")
+    iterations = config.get("loadtest_iterations")
+    table_db_parameters = {
+        table_name: get_db_parameters(get_table_database_url(config, table_name))
+        for table_name in LOADTEST_PATTERN_TABLES.get(pattern_name)
+    }
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [
+            executor.submit(
+                run_loadtest_worker,
+                table_db_parameters,
+                operation,
+                thread_number * iterations + 1,
+                iterations,
+            )
+            for thread_number in range(threads)
+        ]
+        results = [future.result() for future in futures]
+    elapsed_time = time.perf_counter() - start_time
+
+    latencies = sorted(
+        latency * 1000 for latencies, _ in results for latency in latencies
+    )
+    errors = sum(errors for _, errors in results)
+    logging.info(
+        message_info(
+            190,
+            pattern_name,
+            len(latencies),
+            errors,
+            elapsed_time,
+            len(latencies) / elapsed_time if elapsed_time else 0,
+            get_percentile(latencies, 50),
+            get_percentile(latencies, 95),
+            get_percentile(latencies, 99),
+            latencies[-1] if latencies else 0.0,
+        )
+    )
+
+
+# -----------------------------------------------------------------------------
+# Column compression
+# -----------------------------------------------------------------------------
+
+
+def get_column_storage(db_cursor, table_name, column_name):
+    """Storage strategy and compression method of a column, or None if it does not exist."""
+
+    compression = "'pglz'"
+    if db_cursor.connection.server_version >= 140000:
+        compression = "CASE a.attcompression WHEN 'l' THEN 'lz4' WHEN 'p' THEN 'pglz' ELSE current_setting('default_toast_compression') END"
+    db_cursor.execute(
+        "SELECT a.attstorage, {0} FROM pg_attribute a WHERE a.attrelid = to_regclass(%s) AND a.attname = %s AND NOT a.attisdropped".format(
+            compression
+        ),
+        (table_name, column_name.lower()),
+    )
+    return db_cursor.fetchone()
+
+
+def get_recompressed_size(db_cursor, table_name, column_name, compression_method):
+    """Bytes the sampled values take when compressed anew with compression_method.
+    Each value shares its row with a PLAIN filler that pushes the row past the TOAST
+    threshold, so every value is offered for compression whatever its own width.
+    Values that do not shrink enough are kept uncompressed, as in the real table.
+    """
+
+    compression = ""
+    if db_cursor.connection.server_version >= 140000:
+        compression = "COMPRESSION {0}".format(compression_method)
+    db_cursor.execute(
+        "CREATE TEMPORARY TABLE init_postgresql_compression (filler TEXT, value TEXT {0}) ON COMMIT DROP".format(
+            compression
+        )
+    )
+    db_cursor.execute(
+        "ALTER TABLE init_postgresql_compression ALTER COLUMN filler SET STORAGE PLAIN"
+    )
+    db_cursor.execute(
+        sql.SQL(
+            "INSERT INTO init_postgresql_compression SELECT repeat('x', {0}), {1} || '' FROM {2} WHERE {1} IS NOT NULL LIMIT {3}"
+        ).format(
+            sql.Literal(COMPRESSION_REPORT_FILLER_BYTES),
+            sql.Identifier(column_name.lower()),
+            sql.Identifier(table_name.lower()),
+            sql.Literal(COMPRESSION_REPORT_SAMPLE_ROWS),
+        )
+    )
+    db_cursor.execute(
+        "SELECT coalesce(sum(pg_column_size(value)), 0) FROM init_postgresql_compression"
+    )
+    result = db_cursor.fetchone()[0]
+    db_cursor.execute("DROP TABLE init_postgresql_compression")
+    return result
+
+
+def report_column_compression(db_connection, table_name, column_name):
+    """Log raw, stored and recompressed sizes of sampled values of one column."""
+
+    db_cursor = db_connection.cursor()
+    try:
+        column_storage = get_column_storage(db_cursor, table_name, column_name)
+        sample = None
+        if column_storage:
+            db_cursor.execute(
+                sql.SQL(
+                    "SELECT count(*), coalesce(sum(octet_length({0})), 0), coalesce(sum(pg_column_size({0})), 0) FROM (SELECT {0} FROM {1} WHERE {0} IS NOT NULL LIMIT {2}) AS sample"
+                ).format(
+                    sql.Identifier(column_name.lower()),
+                    sql.Identifier(table_name.lower()),
+                    sql.Literal(COMPRESSION_REPORT_SAMPLE_ROWS),
+                )
+            )
+            sample = db_cursor.fetchone()
+        if not sample or not sample[0]:
+            logging.info(
+                message_info(213, db_connection.info.dbname, table_name, column_name)
+            )
+            return
+
+        compression_methods = ["pglz"]
+        if is_lz4_supported(db_connection):
+            compression_methods.append("lz4")
+        recompressed = []
+        db_cursor.execute("BEGIN")
+        try:
+            for compression_method in compression_methods:
+                size = get_recompressed_size(
+                    db_cursor, table_name, column_name, compression_method
+                )
+                recompressed.append(
+                    "{0} {1} ({2:.0%})".format(
+                        compression_method,
+                        format_size(size),
+                        size / sample[1] if sample[1] else 0,
+                    )
+                )
+        finally:
+            db_cursor.execute("ROLLBACK")
+
+        logging.info(
+            message_info(
+                212,
+                db_connection.info.dbname,
+                table_name,
+                column_name,
+                sample[0],
+                format_size(sample[1]),
+                format_size(sample[2]),
+                COMPRESSION_STORAGE_STRATEGIES.get(
+                    column_storage[0], column_storage[0]
+                ),
+                column_storage[1],
+                ", ".join(recompressed),
+            )
+        )
+    except psycopg2.DatabaseError as error:
+        logging.error(message_error(702, " ".join(str(error).split())))
+    finally:
+        db_cursor.close()
+
+
+# -----------------------------------------------------------------------------
+# Server tuning
+# -----------------------------------------------------------------------------
+
+
+def get_pg_settings(db_connection):
+    """Return {name: (setting, unit)} from pg_settings."""
+
+    db_cursor = db_connection.cursor()
+    db_cursor.execute("SELECT name, setting, unit FROM pg_settings")
+    result = {name: (setting, unit) for name, setting, unit in db_cursor.fetchall()}
+    db_cursor.close()
+    return result
+
+
+def get_setting_value(pg_settings, name):
+    """Return a setting in base units: bytes for memory, seconds for time."""
+
+    setting, unit = pg_settings.get(name, (None, None))
+    if setting is None:
+        return None
+    return float(setting) * SETTING_UNIT_MULTIPLIERS.get(unit or "", 1)
+
+
+def format_bytes(value):
+    """Format a number of bytes the way postgresql.conf does."""
+
+    if value >= GIGABYTES and value % GIGABYTES == 0:
+        return "{0}GB".format(int(value // GIGABYTES))
+    return "{0}MB".format(int(value // MEGABYTES))
+
+
+def get_tuning_recommendations(pg_settings, config):
+    """Compare server settings with the Senzing rule set.
+    Return a list of recommendations, most important first."""
+
+    result = []
+    memory = config.get("tune_memory_in_gigabytes", 0) * GIGABYTES
+    loader_connections = config.get("tune_loader_threads", 0) * config.get(
+        "tune_loader_nodes", 1
+    )
+
+    # Senzing opens a connection per loader thread on each node.
+
+    max_connections = get_setting_value(pg_settings, "max_connections")
+    if loader_connections:
+        needed_connections = loader_connections + TUNING_CONNECTION_HEADROOM
+        if max_connections < needed_connections:
+            result.append(
+                {
+                    "priority": 1,
+                    "name": "max_connections",
+                    "value": str(needed_connections),
+                    "current": str(int(max_connections)),
+                    "reason": "Loader threads times nodes, plus headroom. Requires restart.",
+                }
+            )
+
+    # Memory-based settings.
+
+    if memory:
+        shared_buffers = get_setting_value(pg_settings, "shared_buffers")
+        recommended = (memory // 4) // MEGABYTES * MEGABYTES
+        if shared_buffers < recommended * 0.9:
+            result.append(
+                {
+                    "priority": 1 if shared_buffers < recommended / 2 else 2,
+                    "name": "shared_buffers",
+                    "value": format_bytes(recommended),
+                    "current": format_bytes(shared_buffers),
+                    "reason": "About 25% of memory keeps hot Senzing indexes cached. Requires restart.",
+                }
+            )
+        effective_cache_size = get_setting_value(pg_settings, "effective_cache_size")
+        recommended = (memory * 3 // 4) // MEGABYTES * MEGABYTES
+        if effective_cache_size < recommended * 0.9:
+            result.append(
+                {
+                    "priority": 3,
+                    "name": "effective_cache_size",
+                    "value": format_bytes(recommended),
+                    "current": format_bytes(effective_cache_size),
+                    "reason": "About 75% of memory. Guides the planner towards index scans.",
+                }
+            )
+
+    # Write-ahead log and checkpoints.
+
+    max_wal_size = get_setting_value(pg_settings, "max_wal_size")
+    if max_wal_size < TUNING_MAX_WAL_SIZE:
+        result.append(
+            {
+                "priority": 1 if max_wal_size < TUNING_MAX_WAL_SIZE / 4 else 2,
+                "name": "max_wal_size",
+                "value": format_bytes(TUNING_MAX_WAL_SIZE),
+                "current": format_bytes(max_wal_size),
+                "reason": "Loading otherwise forces frequent checkpoints.",
+            }
+        )
+
+    checkpoint_timeout = get_setting_value(pg_settings, "checkpoint_timeout")
+    if checkpoint_timeout < TUNING_CHECKPOINT_TIMEOUT:
+        result.append(
+            {
+                "priority": 2,
+                "name": "checkpoint_timeout",
+                "value": "{0}min".format(TUNING_CHECKPOINT_TIMEOUT // 60),
+                "current": "{0}s".format(int(checkpoint_timeout)),
+                "reason": "Fewer checkpoints means fewer full-page writes during loading.",
+            }
+        )
+
+    # Storage.
+
+    effective_io_concurrency = get_setting_value(
+        pg_settings, "effective_io_concurrency"
+    )
+    if (
+        effective_io_concurrency is not None
+        and effective_io_concurrency < TUNING_EFFECTIVE_IO_CONCURRENCY / 2
+    ):
+        result.append(
+            {
+                "priority": 3,
+                "name": "effective_io_concurrency",
+                "value": str(TUNING_EFFECTIVE_IO_CONCURRENCY),
+                "current": str(int(effective_io_concurrency)),
+                "reason": "Assumes SSD or NVMe storage.",
+            }
+        )
+
+    return sorted(result, key=lambda recommendation: recommendation.get("priority"))
+
+
+def get_alter_system_script(server, recommendations):
+    """Return an ALTER SYSTEM script applying the recommendations."""
+
+    result = ["-- {0}: generated by init-postgresql {1}".format(server, __version__)]
+    for recommendation in recommendations:
+        result.append(
+            "-- [{0}] {1}".format(
+                TUNING_PRIORITIES.get(recommendation.get("priority")),
+                recommendation.get("reason"),
+            )
+        )
+        result.append(
+            "ALTER SYSTEM SET {0} = '{1}';".format(
+                recommendation.get("name"), recommendation.get("value")
+            )
+        )
+    result.append("SELECT pg_reload_conf();")
+    return "\n".join(result)
+
+
+def get_server_output_file(output_file, server, server_count):
+    """With several servers, add the server to the file name, e.g. tune-db1-5432.sql."""
+
+    if server_count == 1:
+        return output_file
+    root, extension = os.path.splitext(output_file)
+    return "{0}-{1}{2}".format(root, re.sub(r"[^\w.]", "-", server), extension)
+
+
+# -----------------------------------------------------------------------------
+# Capacity planning
+# -----------------------------------------------------------------------------
+
+
+def format_size(value):
+    """Format a number of bytes for reports."""
+
+    for unit, size in [
+        ("TB", 1024 * GIGABYTES),
+        ("GB", GIGABYTES),
+        ("MB", MEGABYTES),
+        ("kB", KILOBYTES),
+    ]:
+        if value >= size:
+            return "{0:.1f} {1}".format(value / size, unit)
+    return "{0} B".format(int(value))
+
+
+def split_sql_list(a_string):
+    """Split a comma-separated SQL list, ignoring commas inside parentheses."""
+
+    result = [""]
+    depth = 0
+    for character in a_string:
+        if character == "," and depth == 0:
+            result.append("")
+            continue
+        depth += {"(": 1, ")": -1}.get(character, 0)
+        result[-1] += character
+    return [item.strip() for item in result if item.strip()]
+
+
+def get_column_width(column_name, column_type, column_length):
+    """Average stored width of a column, estimated from its definition."""
+
+    column_type = column_type.upper()
+    if column_type in CAPACITY_COLUMN_WIDTHS:
+        return CAPACITY_COLUMN_WIDTHS.get(column_type)
+    if column_type == "CHAR":
+        result = column_length or 1
+    elif column_type == "VARCHAR":
+        result = math.ceil(
+            (column_length or CAPACITY_TEXT_WIDTH) * CAPACITY_VARCHAR_FILL
+        )
+    else:
+        result = CAPACITY_TEXT_COLUMN_WIDTHS.get(column_name, CAPACITY_TEXT_WIDTH)
+
+    # Variable-length values carry a 1-byte header up to 126 bytes, else 4 bytes.
+
+    return result + (1 if result < 127 else 4)
+
+
+def get_capacity_schema(config):
+    """Tables in the SQL file, with the indexes of SENZING_INDEX_PROFILE and the
+    SYS_EVAL_QUEUE of SENZING_EVAL_QUEUE_LAYOUT. Return {table: {"columns": {column: width},
+    "indexes": {index: (method, columns)}, "fillfactor": percent}}.
+    """
+
+    result = {}
+    sql_context = {
+        "index_profile": config.get("index_profile") or "default",
+        "eval_queue_layout": config.get("eval_queue_layout", "default"),
+    }
+    for sql_statement in read_sql_statements(config.get("input_sql_url")):
+        for statement in [
+            transformed_statement
+            for index_statement in transform_index_profile(sql_statement, sql_context)
+            for transformed_statement in transform_eval_queue_layout(
+                index_statement, sql_context
+            )
+        ]:
+            match = SQL_CREATE_TABLE_REGEX.match(statement)
+            if match:
+                table_name = match.group(1).upper()
+                table = result.setdefault(
+                    table_name, {"columns": {}, "indexes": {}, "fillfactor": 100}
+                )
+                fillfactor = SQL_FILLFACTOR_REGEX.search(statement)
+                if fillfactor:
+                    table["fillfactor"] = int(fillfactor.group(1))
+                for item in split_sql_list(match.group(2)):
+                    primary_key = SQL_PRIMARY_KEY_REGEX.search(item)
+                    if item.upper().startswith("PRIMARY KEY"):
+                        table["indexes"][table_name + "_PKEY"] = (
+                            "btree",
+                            [
+                                column.split()[0].upper()
+                                for column in split_sql_list(
+                                    primary_key.group(1).strip()[1:-1]
+                                )
+                            ],
+                        )
+                        continue
+                    column = SQL_COLUMN_DEFINITION_REGEX.match(item)
+                    if not column:
+                        continue
+                    column_name = column.group(1).upper()
+                    table["columns"][column_name] = get_column_width(
+                        column_name,
+                        column.group(2),
+                        int(column.group(3)) if column.group(3) else None,
+                    )
+                    if primary_key:
+                        table["indexes"][table_name + "_PKEY"] = (
+                            "btree",
+                            [column_name],
+                        )
+                continue
+
+            match = SQL_INDEX_COLUMNS_REGEX.match(statement)
+            if match:
+                table = result.setdefault(
+                    match.group(2).upper(), {"columns": {}, "indexes": {}}
+                )
+                table["indexes"][match.group(1).upper()] = (
+                    (match.group(3) or "btree").lower(),
+                    [
+                        column.split()[0].upper()
+                        for column in split_sql_list(
+                            match.group(4) + "," + (match.group(5) or "")
+                        )
+                    ],
+                )
+    return result
+
+
+def get_capacity_units(config):
+    """Workload units that table row counts are multiples of."""
+
+    records = config.get("capacity_records")
+    features = records * config.get("capacity_features_per_record")
+    entities = (
+        records
+        * CAPACITY_ENTITIES_PER_RECORD
+        / (
+            1
+            + CAPACITY_CROSS_SOURCE_MATCH_RATE
+            * (config.get("capacity_data_sources") - 1)
+        )
+    )
+    return {
+        "records": records,
+        "features": features,
+        "distinct_features": features * CAPACITY_DISTINCT_FEATURE_RATIO,
+        "entities": entities,
+        "relationships": entities * CAPACITY_RELATIONSHIPS_PER_ENTITY,
+    }
+
+
+def sample_column_widths(db_connection, table_name, column_names):
+    """Average stored column widths over existing rows. None if the table is missing or empty."""
+
+    db_cursor = db_connection.cursor()
+    try:
+        db_cursor.execute("SELECT to_regclass(%s)", (table_name,))
+        if db_cursor.fetchone()[0] is None:
+            return None
+        db_cursor.execute(
+            sql.SQL(
+                "SELECT count(*), {0} FROM (SELECT * FROM {1} LIMIT {2}) AS sample"
+            ).format(
+                sql.SQL(", ").join(
+                    sql.SQL("avg(coalesce(pg_column_size({0}), 0))").format(
+                        sql.Identifier(column_name.lower())
+                    )
+                    for column_name in column_names
+                ),
+                sql.Identifier(table_name.lower()),
+                sql.Literal(CAPACITY_SAMPLE_ROWS),
+            )
+        )
+        row = db_cursor.fetchone()
+    finally:
+        db_cursor.close()
+    if not row[0]:
+        return None
+    return {
+        column_name: float(width) for column_name, width in zip(column_names, row[1:])
+    }
+
+
+def get_aligned(value):
+    """Round a width up to the 8-byte alignment of tuples."""
+
+    return math.ceil(value / 8) * 8
+
+
+def get_page_count(rows, entry_width, fill=1.0):
+    """Pages needed for rows of a given width, each also taking a line pointer."""
+
+    entries_per_page = max(
+        1,
+        int(
+            (CAPACITY_PAGE_SIZE - CAPACITY_PAGE_HEADER)
+            * fill
+            // (entry_width + CAPACITY_LINE_POINTER)
+        ),
+    )
+    return math.ceil(rows / entries_per_page)
+
+
+def project_table_capacity(table, rows, column_widths, unlogged):
+    """Project heap, index and initial load WAL bytes of one table."""
+
+    tuple_width = CAPACITY_HEAP_TUPLE_HEADER + get_aligned(sum(column_widths.values()))
+    heap = (
+        get_page_count(rows, tuple_width, table.get("fillfactor", 100) / 100)
+        * CAPACITY_PAGE_SIZE
+    )
+    wal = rows * (tuple_width + CAPACITY_WAL_RECORD_OVERHEAD)
+    indexes = 0
+    for method, column_names in table.get("indexes").values():
+        key_width = CAPACITY_HASH_KEY_WIDTH
+        if method != "hash":
+            key_width = sum(
+                column_widths.get(column_name, 8) for column_name in column_names
+            )
+        entry_width = CAPACITY_INDEX_TUPLE_HEADER + get_aligned(key_width)
+        indexes += (
+            get_page_count(rows, entry_width, CAPACITY_INDEX_FILL.get(method, 0.7))
+            * CAPACITY_PAGE_SIZE
+        )
+        wal += rows * (entry_width + CAPACITY_WAL_RECORD_OVERHEAD)
+
+    # After each checkpoint, the first change to a page writes the whole page to WAL.
+
+    return {
+        "rows": rows,
+        "row_width": tuple_width,
+        "heap": heap,
+        "index_count": len(table.get("indexes")),
+        "indexes": indexes,
+        "wal": 0 if unlogged else wal + heap + indexes,
+    }
+
+
+def get_sampled_column_widths(
+    database_url, table_name, column_names, unreachable_database_urls
+):
+    """Sampled column widths of a table that already has rows, else None."""
+
+    if not database_url or database_url in unreachable_database_urls:
+        return None
+    db_parameters = get_db_parameters(database_url)
+    try:
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            return sample_column_widths(db_connection, table_name, column_names)
+    except psycopg2.Error as err:
+        logging.warning(
+            message_warning(
+                310, db_parameters.get("dbname"), table_name, " ".join(str(err).split())
+            )
+        )
+        if isinstance(err, psycopg2.OperationalError):
+            unreachable_database_urls.add(database_url)
+    return None
+
+
+# -----------------------------------------------------------------------------
+# Senzing services.
+# -----------------------------------------------------------------------------
+
+
+def get_g2_configuration_dictionary(config, schema=None):
+    """Construct a dictionary in the form of the old ini files."""
+
+    result = {
+        "PIPELINE": {
+            "CONFIGPATH": config.get("etc_dir"),
+            "RESOURCEPATH": "{0}/resources".format(config.get("g2_dir")),
+            "SUPPORTPATH": config.get("data_dir"),
+        },
+        "SQL": {
+            "BACKEND": "SQL",
+            "CONNECTION": create_senzing_database_connection_string(
+                config.get("database_url"), schema
+            ),
+        },
+    }
+    return result
+
+
+def get_g2_configuration_json(config):
+    """Return a JSON string with Senzing configuration."""
+    result = ""
+    if config.get("engine_configuration_json"):
+        result = config.get("engine_configuration_json")
+    else:
+        result = json.dumps(get_g2_configuration_dictionary(config))
+    return result
+
+
+# -----------------------------------------------------------------------------
+# Senzing services.
+# -----------------------------------------------------------------------------
+
+
+def get_database_connection_manager(config=None):
+    """Get the process-wide DatabaseConnectionManager."""
+    global DATABASE_CONNECTION_MANAGER_SINGLETON
+
+    if DATABASE_CONNECTION_MANAGER_SINGLETON:
+        return DATABASE_CONNECTION_MANAGER_SINGLETON
+
+    max_connections_per_database = CONFIGURATION_LOCATOR.get(
+        "max_connections_per_database"
+    ).get("default")
+    if config:
+        max_connections_per_database = config.get(
+            "max_connections_per_database", max_connections_per_database
+        )
+
+    result = DatabaseConnectionManager(max_connections_per_database)
+    DATABASE_CONNECTION_MANAGER_SINGLETON = result
+    return result
+
+
+def update_senzing_configuration(
+    config,
+    g2_configuration_json,
+    g2_configuration_manager_name,
+    db_parameters,
+    initial_configuration_json=None,
+):
+    """Create the default configuration and apply modifications through a dedicated G2ConfigMgr.
+    The modifications are journaled in the database described by db_parameters.
+    Return the initial configuration JSON so it can be reused."""
+
+    configuration_modifications = config.get("configuration_modifications")
+    g2_config = get_g2_config(config)
+    g2_configuration_manager = G2ConfigMgr()
+    try:
+        g2_configuration_manager.init(
+            g2_configuration_manager_name, g2_configuration_json, config.get("debug")
+        )
+    except G2Exception as err:
+        exit_error(896, g2_configuration_json, err)
+
+    g2_initializer = G2Initializer(
+        trace_g2_configuration_manager(g2_configuration_manager, g2_configuration_json),
+        g2_config,
+        initial_configuration_json,
+    )
+    try:
+        default_config_id = g2_initializer.create_default_config_id()
+        if default_config_id:
+            logging.info(message_info(170, default_config_id.decode()))
+        if configuration_modifications is not None and not config.get(
+            "configuration_file"
+        ):
+            apply_configuration_modifications(
+                g2_initializer, db_parameters, configuration_modifications
+            )
+    except Exception as err:
+        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+
+    g2_configuration_manager.destroy()
+    return g2_initializer.initial_configuration_json
+
+
+def apply_configuration_modifications(
+    g2_initializer, db_parameters, configuration_modifications
+):
+    """Apply the configuration modification lines that the database's journal
+    does not record as applied, then journal them.
+    Each line is journaled on its own, so a restart after lines were added
+    applies only the new ones."""
+
+    configuration_modification_lines = get_unfinished_steps(
+        db_parameters,
+        "CONFIGURATION_MODIFICATIONS",
+        [line for line in configuration_modifications.split("\n") if line],
+    )
+    if not configuration_modification_lines:
+        logging.info(message_info(193))
+        return
+    g2_initializer.process_configuration_modifications(
+        "\n".join(configuration_modification_lines)
+    )
+    record_steps_finished(
+        db_parameters, "CONFIGURATION_MODIFICATIONS", configuration_modification_lines
+    )
+
+
+def read_configuration_file(config):
+    """Return the Senzing configuration JSON snapshot in SENZING_CONFIGURATION_FILE, or None."""
+
+    configuration_file = config.get("configuration_file")
+    if not configuration_file:
+        return None
+    with open(configuration_file, "r", encoding="utf-8") as input_file:
+        result = input_file.read()
+    json.loads(result)
+    return result
+
+
+def get_g2_config(config, g2_config_name="init-container-G2-config"):
+    """Get the G2Config resource."""
+    global G2_CONFIG_SINGLETON
+
+    if G2_CONFIG_SINGLETON:
+        return G2_CONFIG_SINGLETON
+
+    try:
+        g2_configuration_json = get_g2_configuration_json(config)
+        result = G2Config()
+        result.init(g2_config_name, g2_configuration_json, config.get("debug"))
+    except G2Exception as err:
+        exit_error(897, g2_configuration_json, err)
+
+    G2_CONFIG_SINGLETON = result
+    return result
+
+
+def get_g2_configuration_manager(
+    config, g2_configuration_manager_name="init-container-G2-configuration-manager"
+):
+    """Get the G2ConfigMgr resource."""
+    global G2_CONFIGURATION_MANAGER_SINGLETON
+
+    if G2_CONFIGURATION_MANAGER_SINGLETON:
+        return G2_CONFIGURATION_MANAGER_SINGLETON
+
+    try:
+        g2_configuration_json = get_g2_configuration_json(config)
+        result = G2ConfigMgr()
+        result.init(
+            g2_configuration_manager_name, g2_configuration_json, config.get("debug")
+        )
+    except G2Exception as err:
+        exit_error(896, g2_configuration_json, err)
+
+    G2_CONFIGURATION_MANAGER_SINGLETON = trace_g2_configuration_manager(
+        result, g2_configuration_json
+    )
+    return G2_CONFIGURATION_MANAGER_SINGLETON
+
+
+def trace_g2_configuration_manager(g2_configuration_manager, g2_configuration_json):
+    """If tracing is enabled, wrap the G2ConfigMgr so its database calls are traced."""
+
+    if not TRACER_SINGLETON:
+        return g2_configuration_manager
+    db_url_raw = json.loads(g2_configuration_json).get("SQL", {}).get("CONNECTION")
+    db_parameters = get_db_parameters(create_database_url(db_url_raw, ":", "/", 1))
+    database = "{0}:{1}/{2}".format(
+        db_parameters.get("host"),
+        db_parameters.get("port"),
+        db_parameters.get("dbname"),
+    )
+    return TracedG2ConfigMgr(g2_configuration_manager, database)
+
+
+def start_tracing(trace_file):
+    """Enable tracing of SQL statements and G2 calls into a JSON lines file."""
+    global TRACER_SINGLETON
+
+    TRACER_SINGLETON = Tracer(trace_file)
+
+
+def stop_tracing():
+    """Close the trace file, if any."""
+    global TRACER_SINGLETON
+
+    if TRACER_SINGLETON:
+        TRACER_SINGLETON.close()
+        TRACER_SINGLETON = None
+
+
+# -----------------------------------------------------------------------------
+# tasks
+#   Common function signature: task_XXX(config)
+# -----------------------------------------------------------------------------
+
+
+def task_export_senzing_configuration(config):
+    """Write the default Senzing configuration to a file."""
+
+    g2_initializer = G2Initializer(get_g2_configuration_manager(config), None)
+    try:
+        configuration_id, configuration_json = (
+            g2_initializer.get_default_configuration()
+        )
+    except Exception as err:
+        exit_error(701, err, type(err.__cause__), err.__cause__)
+    if not configuration_id:
+        exit_error(710)
+
+    with open(config.get("configuration_file"), "w", encoding="utf-8") as output_file:
+        output_file.write(configuration_json)
+    logging.info(message_info(194, configuration_id, config.get("configuration_file")))
+
+
+def task_import_senzing_configuration(config):
+    """Make the configuration in a file the default, bypassing create and modify."""
+
+    configuration_file = config.get("configuration_file")
+    g2_initializer = G2Initializer(get_g2_configuration_manager(config), None)
+    try:
+        configuration_id = g2_initializer.import_configuration(
+            read_configuration_file(config),
+            "Imported by init-postgresql from {0}".format(
+                os.path.basename(configuration_file)
+            ),
+        )
+    except Exception as err:
+        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+        return
+    if configuration_id:
+        logging.info(message_info(196, configuration_file, configuration_id))
+    else:
+        logging.info(
+            message_info(
+                195, configuration_file, g2_initializer.get_default_configuration()[0]
+            )
+        )
+
+
+def task_preflight(config):
+    """Check every database concurrently. Exit with a per-database report on any problem."""
+
+    start_time = time.time()
+    problems = get_engine_configuration_problems(config)
+    if problems:
+        for problem in problems:
+            logging.error(
+                message_error(715, "SENZING_ENGINE_CONFIGURATION_JSON", problem)
+            )
+        exit_error(716, 1, 1)
+
+    databases = get_preflight_databases(config)
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        futures = [
+            executor.submit(preflight_database, config, db_parameters)
+            for db_parameters in databases
+        ]
+
+    failed = 0
+    for db_parameters, future in zip(databases, futures):
+        name = "{0}:{1}/{2}".format(
+            db_parameters.get("host"),
+            db_parameters.get("port"),
+            db_parameters.get("dbname"),
+        )
+        try:
+            problems, details = future.result()
+        except (Exception, psycopg2.DatabaseError) as err:
+            problems, details = [" ".join(str(err).split())], None
+        for problem in problems:
+            logging.error(message_error(715, name, problem))
+        if problems:
+            failed += 1
+        elif not details:
+            logging.info(message_info(201, name))
+        else:
+            logging.info(
+                message_info(
+                    200,
+                    name,
+                    details.get("server_version"),
+                    details.get("connect_ms"),
+                    details.get("round_trip_ms"),
+                )
+            )
+            if details.get("unlogged_tables"):
+                logging.warning(
+                    message_warning(
+                        306, name, ", ".join(details.get("unlogged_tables"))
+                    )
+                )
+            if details.get("round_trip_ms") > PREFLIGHT_LATENCY_WARNING_IN_MILLISECONDS:
+                logging.warning(
+                    message_warning(
+                        305,
+                        name,
+                        details.get("round_trip_ms"),
+                        PREFLIGHT_LATENCY_WARNING_IN_MILLISECONDS,
+                    )
+                )
+
+    if failed:
+        exit_error(716, failed, len(databases))
+    logging.info(message_info(202, len(databases), time.time() - start_time))
+
+
+def task_report_column_compression(config):
+    """Report compression of the large TEXT columns, on the database holding each table."""
+
+    for table_name, compressed_columns in COMPRESSED_COLUMNS.items():
+        db_parameters = get_db_parameters(get_table_database_url(config, table_name))
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            for column_name in compressed_columns:
+                report_column_compression(db_connection, table_name, column_name)
+
+
+def task_finalize_unlogged_tables(config):
+    """Set every UNLOGGED table logged, in parallel across tables and databases."""
+
+    start_time = time.time()
+    databases = {
+        DatabaseConnectionManager.get_key(db_parameters): db_parameters
+        for db_parameters in get_preflight_databases(config)
+    }
+    jobs = []
+    for db_parameters in databases.values():
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            db_cursor = db_connection.cursor()
+            jobs.extend(
+                (db_parameters, table_name)
+                for table_name in get_unlogged_tables(db_cursor)
+            )
+            db_cursor.close()
+    logging.info(message_info(205, len(jobs), len(databases)))
+
+    # The connection manager bounds the concurrency on each database.
+
+    failed_databases = set()
+    max_workers = max(
+        1, min(len(jobs), len(databases) * config.get("max_connections_per_database"))
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(set_table_logged, db_parameters, table_name): (
+                db_parameters,
+                table_name,
+            )
+            for db_parameters, table_name in jobs
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            db_parameters, table_name = futures.get(future)
+            try:
+                table_size = future.result()
+            except (Exception, psycopg2.DatabaseError) as err:
+                failed_databases.add(DatabaseConnectionManager.get_key(db_parameters))
+                logging.error(
+                    message_error(
+                        717,
+                        db_parameters.get("dbname"),
+                        table_name,
+                        " ".join(str(err).split()),
+                    )
+                )
+                continue
+            logging.info(
+                message_info(
+                    203,
+                    db_parameters.get("dbname"),
+                    table_name,
+                    table_size,
+                    done,
+                    len(jobs),
+                    time.time() - start_time,
+                )
+            )
+
+    # Record the logging mode where tables were switched and every one made it.
+
+    switched_databases = {
+        DatabaseConnectionManager.get_key(db_parameters) for db_parameters, _ in jobs
+    }
+    for key, db_parameters in databases.items():
+        if key in failed_databases or key not in switched_databases:
+            continue
+        try:
+            with get_database_connection_manager().connection(
+                db_parameters
+            ) as db_connection:
+                recorded = set_sys_var(db_connection, "LOGGING_MODE", "LOGGED")
+        except psycopg2.DatabaseError as err:
+            logging.error(message_error(702, " ".join(str(err).split())))
+            continue
+        if recorded:
+            logging.info(message_info(204, db_parameters.get("dbname")))
+        else:
+            logging.warning(message_warning(315, db_parameters.get("dbname")))
+
+
+def task_initialize_databases(config):
+    """Create schemas, session settings and the Senzing configuration."""
+
+    task_preflight(config)
+    task_clone_template_database(config)
+    task_process_sql_file(config)
+    task_apply_session_settings(config)
+
+    # Only one instance at a time may create and modify the default configuration.
+
+    main_db_parameters = get_db_parameters(get_main_database_url(config))
+    with database_advisory_lock(main_db_parameters):
+        task_update_senzing_configuration(config)
+        task_modify_senzing_configuration(config)
+
+
+def task_reconcile(config):
+    """Poll the modifications file and the SQL file. Apply only what was added."""
+
+    reconcile_interval_in_seconds = config.get("reconcile_interval_in_seconds")
+    watched = {}
+    for name in ["configuration_modifications_file", "input_sql_url"]:
+        path = get_local_path(config.get(name))
+        if path:
+            watched[name] = {"path": path, "signature": get_file_signature(path)}
+    watched_lines = {
+        "configuration_modifications_file": (
+            config.get("configuration_modifications") or ""
+        ).split("\n"),
+        "input_sql_url": list(read_sql_statements(config.get("input_sql_url"))),
+    }
+    logging.info(
+        message_info(
+            198,
+            reconcile_interval_in_seconds,
+            ", ".join(details.get("path") for details in watched.values()),
+        )
+    )
+
+    # A failed pass is logged and retried at the next interval. Reconciling never stops.
+
+    while True:
+        time.sleep(reconcile_interval_in_seconds)
+        for name, details in watched.items():
+            try:
+                reconcile_watched_file(config, name, details, watched_lines)
+            except Exception as err:
+                logging.error(
+                    message_error(722, details.get("path"), " ".join(str(err).split()))
+                )
+
+
+def reconcile_watched_file(config, name, details, watched_lines):
+    """Apply the lines added to a watched file since it was last read.
+    What was read is only remembered once it has been applied."""
+
+    path = details.get("path")
+    signature = get_file_signature(path)
+    if signature == details.get("signature"):
+        return
+    if signature is None:
+        logging.warning(message_warning(313, path))
+        details["signature"] = None
+        return
+
+    if name == "input_sql_url":
+        new_lines = list(read_sql_statements(config.get("input_sql_url")))
+    else:
+        new_lines = read_configuration_modifications(config).split("\n")
+    added_lines, changed_lines, removed_lines = get_line_changes(
+        watched_lines.get(name), new_lines
+    )
+    if removed_lines:
+        logging.warning(message_warning(304, path, " | ".join(removed_lines)))
+    for old_line, new_line in changed_lines:
+        logging.warning(message_warning(314, path, old_line, new_line))
+    if added_lines:
+        logging.info(message_info(199, path, len(added_lines)))
+        if name == "input_sql_url":
+            reconcile_sql_statements(config, added_lines)
+        else:
+            reconcile_configuration_modifications(config, "\n".join(added_lines))
+
+    details["signature"] = signature
+    watched_lines[name] = new_lines
+
+
+def task_modify_senzing_configuration(config):
+    """Insert Senzing configuration into the database."""
+
+    configuration_modifications = config.get("configuration_modifications")
+
+    if configuration_modifications is None:
+        return
+
+    # A configuration snapshot is used as is.
+    # A database cloned from the template already has the modifications.
+
+    if config.get("configuration_file"):
+        return
+    if get_main_database_url(config) in config.get("cloned_database_urls", []):
+        return
+
+    # Get Senzing resources.
+
+    g2_config = get_g2_config(config)
+    g2_configuration_manager = get_g2_configuration_manager(config)
+
+    # Modify G2 configuration. Lines already applied by an earlier run,
+    # or by another instance that held the lock first, are not applied twice.
+
+    g2_initializer = G2Initializer(g2_configuration_manager, g2_config)
+    try:
+        apply_configuration_modifications(
+            g2_initializer,
+            get_db_parameters(get_main_database_url(config)),
+            configuration_modifications,
+        )
+    except Exception as err:
+        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+
+
+def task_process_sql_file(config):
+    """Process a file of SQL statements."""
+
+    input_url = config.get("input_sql_url")
+    cloned_database_urls = config.get("cloned_database_urls", [])
+
+    # Run the input SQL file against all databases.
+    # Databases cloned from a template database are already initialized.
+
+    for database_url in get_database_urls(config):
+        if database_url in cloned_database_urls:
+            continue
+        db_parameters = get_db_parameters(database_url)
+        with database_advisory_lock(db_parameters) as waited:
+            if waited and is_database_initialized(db_parameters):
+                logging.info(message_info(180, db_parameters.get("dbname")))
+                continue
+            try:
+                process_sql_file(input_url, db_parameters, config)
+            except Exception as err:
+                if err.__cause__ is None:
+                    raise
+                exit_error(
+                    723,
+                    db_parameters.get("dbname"),
+                    err,
+                    " ".join(str(err.__cause__).split()),
+                )
+
+
+def task_provision_tenant_schemas(config):
+    """Create tenant schemas and process a file of SQL statements in each of them."""
+
+    start_time = time.time()
+    tenant_schemas = get_tenant_schemas(config)
+    tenant_threads = max(1, min(config.get("tenant_threads"), len(tenant_schemas)))
+
+    # All tenants live in the same database, so they share one pool of connections.
+    # search_path is set per tenant, so drop any "?schema=" from the database URL.
+
+    db_parameters = get_db_parameters(config.get("database_url"))
+    db_parameters.pop("options", None)
+
+    # The SQL file is read and transformed once and shared by all tenants.
+
+    with get_database_connection_manager().connection(db_parameters) as db_connection:
+        sql_context = get_sql_context(config, db_connection)
+    sql_statements = list(
+        transform_sql_statements(
+            read_sql_statements(config.get("input_sql_url")), sql_context
+        )
+    )
+
+    with ThreadPoolExecutor(max_workers=tenant_threads) as executor:
+        futures = [
+            executor.submit(
+                provision_tenant_schema,
+                db_parameters,
+                tenant_schema,
+                sql_statements,
+                sql_context,
+            )
+            for tenant_schema in tenant_schemas
+        ]
+
+    # Failed tenant schemas get no Senzing configuration and fail the run at the end.
+
+    config["failed_tenant_schemas"] = [
+        tenant_schema
+        for tenant_schema, future in zip(tenant_schemas, futures)
+        if not future.result()
+    ]
+    logging.info(
+        message_info(
+            175,
+            len(tenant_schemas) - len(config.get("failed_tenant_schemas")),
+            len(tenant_schemas),
+            time.time() - start_time,
+            len(config.get("failed_tenant_schemas")),
+        )
+    )
+
+
+def task_update_tenant_senzing_configurations(config):
+    """Insert Senzing configuration into each provisioned tenant schema."""
+
+    # The initial configuration JSON is read or created once and reused for every tenant.
+
+    initial_configuration_json = read_configuration_file(config)
+    for tenant_schema in get_tenant_schemas(config):
+        if tenant_schema in config.get("failed_tenant_schemas", []):
+            continue
+        db_parameters = get_db_parameters(config.get("database_url"))
+        db_parameters["options"] = f"-c search_path={tenant_schema}"
+        initial_configuration_json = update_senzing_configuration(
+            config,
+            json.dumps(get_g2_configuration_dictionary(config, tenant_schema)),
+            "init-container-G2-configuration-manager-{0}".format(tenant_schema),
+            db_parameters,
+            initial_configuration_json,
+        )
+
+
+def task_clone_template_database(config):
+    """Create missing databases by cloning a fully initialized template database."""
+
+    if not config.get("use_template_database"):
+        return
+
+    g2_initializer = G2Initializer(
+        None, get_g2_config(config), read_configuration_file(config)
+    )
+    initial_configuration_json = g2_initializer.get_initial_configuration_json()
+    template_name = get_template_database_name(config, initial_configuration_json)
+
+    cloned_database_urls = []
+    for database_url in get_database_urls(config):
+        if clone_template_database(
+            config, database_url, template_name, initial_configuration_json
+        ):
+            cloned_database_urls.append(database_url)
+    config["cloned_database_urls"] = cloned_database_urls
+
+
+def task_recommend_server_settings(config):
+    """Log recommended server settings and optionally write an ALTER SYSTEM script."""
+
+    if not config.get("tune_memory_in_gigabytes"):
+        logging.info(message_info(185))
+    if not config.get("tune_loader_threads"):
+        logging.info(message_info(186))
+
+    # Settings are server-wide, so each server is examined once.
+
+    scripts = {}
+    servers = []
+    for database_url in get_database_urls(config):
+        db_parameters = get_db_parameters(database_url)
+        server = "{0}:{1}".format(db_parameters.get("host"), db_parameters.get("port"))
+        if server in servers:
+            continue
+        servers.append(server)
+
+        with get_database_connection_manager().connection(
+            db_parameters
+        ) as db_connection:
+            pg_settings = get_pg_settings(db_connection)
+        server_version = pg_settings.get("server_version", ("",))[0]
+        recommendations = get_tuning_recommendations(pg_settings, config)
+
+        if not recommendations:
+            logging.info(message_info(183, server, server_version))
+            continue
+        logging.info(message_info(184, server, server_version, len(recommendations)))
+        for recommendation in recommendations:
+            logging.info(
+                message_info(
+                    182,
+                    server,
+                    TUNING_PRIORITIES.get(recommendation.get("priority")),
+                    recommendation.get("name"),
+                    recommendation.get("value"),
+                    recommendation.get("current"),
+                    recommendation.get("reason"),
+                )
+            )
+        scripts[server] = get_alter_system_script(server, recommendations)
+
+    # One script per file, so a script cannot be applied to the wrong server.
+
+    tune_output_file = config.get("tune_output_file")
+    if tune_output_file:
+        for server, script in scripts.items():
+            server_output_file = get_server_output_file(
+                tune_output_file, server, len(servers)
+            )
+            with open(server_output_file, "w", encoding="utf-8") as output_file:
+                output_file.write(script)
+                output_file.write("\n")
+            logging.info(message_info(187, server, server_output_file))
+
+
+def task_plan_capacity(config):
+    """Log projected sizes of each Senzing table and database, optionally writing them as JSON."""
+
+    units = get_capacity_units(config)
+    logging.info(
+        message_info(
+            207,
+            *[
+                int(units.get(unit))
+                for unit in [
+                    "records",
+                    "features",
+                    "distinct_features",
+                    "entities",
+                    "relationships",
+                ]
+            ],
+        )
+    )
+
+    unlogged_tables = UNLOGGED_TABLES if config.get("unlogged_tables") else []
+    unreachable_database_urls = set()
+    projections = []
+    for table_name, table in get_capacity_schema(config).items():
+        unit, multiplier = CAPACITY_TABLE_ROWS.get(table_name, (None, 0))
+        rows = int(units.get(unit, 0) * multiplier)
+        if not rows:
+            continue
+
+        # Rows already loaded show real widths; otherwise the SQL file is all there is.
+
+        database_url = get_table_database_url(config, table_name)
+        column_widths = table.get("columns")
+        source = "schema"
+        sampled_column_widths = get_sampled_column_widths(
+            database_url, table_name, list(column_widths), unreachable_database_urls
+        )
+        if sampled_column_widths:
+            column_widths = dict(column_widths, **sampled_column_widths)
+            source = "sampled"
+
+        projection = project_table_capacity(
+            table, rows, column_widths, table_name in unlogged_tables
+        )
+        projection.update(
+            {
+                "database": (
+                    get_db_parameters(database_url).get("dbname")
+                    if database_url
+                    else "-"
+                ),
+                "table": table_name,
+                "width_source": source,
+                "hot": table_name in CAPACITY_HOT_TABLES,
+            }
+        )
+        projections.append(projection)
+        logging.info(
+            message_info(
+                208,
+                projection.get("database"),
+                table_name,
+                rows,
+                projection.get("row_width"),
+                source,
+                format_size(projection.get("heap")),
+                projection.get("index_count"),
+                format_size(projection.get("indexes")),
+                format_size(projection.get("wal")),
+            )
+        )
+
+    # Totals per database, then overall.
+
+    totals = {}
+    for projection in projections:
+        total = totals.setdefault(
+            projection.get("database"),
+            {"heap": 0, "indexes": 0, "wal": 0, "hot_indexes": 0},
+        )
+        total["heap"] += projection.get("heap")
+        total["indexes"] += projection.get("indexes")
+        total["wal"] += projection.get("wal")
+        if projection.get("hot"):
+            total["hot_indexes"] += projection.get("indexes")
+    for database_name, total in totals.items():
+        logging.info(
+            message_info(
+                209,
+                database_name,
+                format_size(total.get("heap")),
+                format_size(total.get("indexes")),
+                format_size(total.get("heap") + total.get("indexes")),
+                format_size(total.get("wal")),
+                format_size(total.get("hot_indexes")),
+            )
+        )
+    overall = {
+        key: sum(total.get(key) for total in totals.values())
+        for key in ["heap", "indexes", "wal", "hot_indexes"]
+    }
+    logging.info(
+        message_info(
+            210,
+            format_size(overall.get("heap")),
+            format_size(overall.get("indexes")),
+            format_size(overall.get("heap") + overall.get("indexes")),
+            format_size(overall.get("wal")),
+            format_size(overall.get("hot_indexes")),
+        )
+    )
+
+    capacity_output_file = config.get("capacity_output_file")
+    if capacity_output_file:
+        with open(capacity_output_file, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "units": units,
+                    "tables": projections,
+                    "databases": totals,
+                    "total": overall,
+                },
+                output_file,
+                indent=4,
+            )
+            output_file.write("\n")
+        logging.info(message_info(211, capacity_output_file))
+
+
+def task_apply_session_settings(config):
+    """Pin session settings for the database user of each database."""
+
+    session_settings = get_session_settings(config)
+    if not session_settings:
+        return
+
+    for database_url in get_database_urls(config):
+        with get_database_connection_manager().connection(
+            get_db_parameters(database_url)
+        ) as db_connection:
+            apply_session_settings(db_connection, session_settings)
+
+
+def task_reset_databases(config):
+    """Reset every database in parallel. SYS_SEQUENCE seeds come from the SQL file."""
+
+    sys_sequence_statements = [
+        sql_statement
+        for sql_statement in read_sql_statements(config.get("input_sql_url"))
+        if SQL_INSERT_SYS_SEQUENCE_REGEX.match(sql_statement)
+    ]
+
+    # Different URLs may name the same database; each database is reset once.
+
+    databases = {}
+    for database_url in get_database_urls(config):
+        db_parameters = get_db_parameters(database_url)
+        databases.setdefault(
+            DatabaseConnectionManager.get_key(db_parameters), db_parameters
+        )
+
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        futures = {
+            executor.submit(
+                reset_database, db_parameters, sys_sequence_statements
+            ): db_parameters
+            for db_parameters in databases.values()
+        }
+    for future, db_parameters in futures.items():
+        try:
+            future.result()
+        except (Exception, psycopg2.DatabaseError) as err:
+            logging.error(
+                message_error(
+                    713, db_parameters.get("dbname"), " ".join(str(err).split())
+                )
+            )
+
+
+def task_run_loadtest(config):
+    """Run each Senzing write pattern, then remove the rows it wrote."""
+
+    loadtest_patterns = {
+        "LIB_FEAT": loadtest_lib_feat,
+        "OBS_ENT": loadtest_obs_ent,
+        "RES_ENT_OKEY": loadtest_res_ent_okey,
+        "SYS_SEQUENCE": loadtest_sys_sequence,
+    }
+
+    try:
+        prepare_loadtest(config)
+        for pattern_name, operation in loadtest_patterns.items():
+            run_loadtest_pattern(config, pattern_name, operation)
+    finally:
+        cleanup_loadtest(config)
+        logging.info(message_info(191))
+
+
+def task_update_senzing_configuration(config):
+    """Insert Senzing configuration into the database."""
+
+    # Get Senzing resources.
+
+    g2_config = get_g2_config(config)
+    g2_configuration_manager = get_g2_configuration_manager(config)
+
+    # Initialize G2 database, from the configuration snapshot if there is one.
+
+    g2_initializer = G2Initializer(
+        g2_configuration_manager, g2_config, read_configuration_file(config)
+    )
+    try:
+        default_config_id = g2_initializer.create_default_config_id()
+        if default_config_id:
+            logging.info(message_info(170, default_config_id.decode()))
+    except Exception as err:
+        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+
+
+# -----------------------------------------------------------------------------
+# do_* functions
+#   Common function signature: do_XXX(args)
+# -----------------------------------------------------------------------------
+
+
+def do_config_export(subcommand, args):
+    """Write the default Senzing configuration to a file."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
     validate_configuration(config)
 
     # Prolog.
@@ -1082,9 +5226,287 @@ def do_mandatory(subcommand, args):
 
     # Do work.
 
-    task_process_sql_file(config)
-    task_update_senzing_configuration(config)
-    task_modify_senzing_configuration(config)
+    task_export_senzing_configuration(config)
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_config_import(subcommand, args):
+    """Make a Senzing configuration snapshot the default configuration."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work. Only one instance at a time may change the default configuration.
+
+    database_connection_manager = get_database_connection_manager(config)
+    main_db_parameters = get_db_parameters(get_main_database_url(config))
+    with database_advisory_lock(main_db_parameters):
+        task_import_senzing_configuration(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_docker_acceptance_test(subcommand, args):
+    """For use with Docker acceptance testing."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_mandatory(subcommand, args):
+    """Do a task."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_initialize_databases(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_tenants(subcommand, args):
+    """Do mandatory tasks for each tenant schema."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_preflight(config)
+    task_provision_tenant_schemas(config)
+    task_update_tenant_senzing_configurations(config)
+    task_apply_session_settings(config)
+    database_connection_manager.close_all()
+    failed_tenant_schemas = config.get("failed_tenant_schemas")
+    if failed_tenant_schemas:
+        exit_error(
+            724,
+            len(failed_tenant_schemas),
+            len(get_tenant_schemas(config)),
+            ", ".join(failed_tenant_schemas),
+        )
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_loadtest(subcommand, args):
+    """Run a synthetic Senzing-shaped load test."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work. Every thread needs its own connection.
+
+    config["max_connections_per_database"] = max(
+        config.get("max_connections_per_database"), config.get("loadtest_threads")
+    )
+    database_connection_manager = get_database_connection_manager(config)
+    task_run_loadtest(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_tune(subcommand, args):
+    """Recommend server settings."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_recommend_server_settings(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_plan_capacity(subcommand, args):
+    """Project storage, WAL and memory needs before provisioning."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work. Connections are only used to sample existing rows.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_plan_capacity(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_compression_report(subcommand, args):
+    """Compare stored and recompressed sizes of large TEXT columns."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_report_column_compression(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_finalize(subcommand, args):
+    """Switch UNLOGGED tables back to logged after an initial load."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_finalize_unlogged_tables(config)
+    database_connection_manager.close_all()
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_preflight(subcommand, args):
+    """Check every database without changing anything."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work.
+
+    task_preflight(config)
+
+    # Epilog.
+
+    logging.info(exit_template(config))
+
+
+def do_reconcile(subcommand, args):
+    """Initialize, then keep G2 objects and connections warm and apply changes as they appear."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+    config["configuration_modifications"] = read_configuration_modifications(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work. Runs until the container is stopped.
+
+    get_database_connection_manager(config)
+    task_initialize_databases(config)
+    task_reconcile(config)
+
+
+def do_reset(subcommand, args):
+    """Remove all entity resolution data, keeping the Senzing configuration."""
+
+    # Get context from CLI, environment variables, and ini files.
+
+    config = get_configuration(subcommand, args)
+    validate_configuration(config)
+
+    # Prolog.
+
+    logging.info(entry_template(config))
+
+    # Do work. Each database needs a connection for its lock and one for the reset.
+
+    database_connection_manager = get_database_connection_manager(config)
+    task_reset_databases(config)
+    database_connection_manager.close_all()
 
     # Epilog.
 
@@ -1193,6 +5615,24 @@ if __name__ == "__main__":
         PARSER.print_help()
         exit_silently()
 
+    # Optionally trace SQL statements and G2 calls, and profile the subcommand.
+
+    TRACE_FILE = getattr(ARGS, "trace_file", None) or os.getenv("SENZING_TRACE_FILE")
+    if TRACE_FILE:
+        start_tracing(TRACE_FILE)
+    PROFILE_FILE = getattr(ARGS, "profile_file", None) or os.getenv(
+        "SENZING_PROFILE_FILE"
+    )
+    PROFILER = cProfile.Profile() if PROFILE_FILE else None
+
     # Tricky code for calling function based on string.
 
-    globals()[SUBCOMMAND_FUNCTION_NAME](SUBCOMMAND, ARGS)
+    try:
+        if PROFILER:
+            PROFILER.runcall(globals()[SUBCOMMAND_FUNCTION_NAME], SUBCOMMAND, ARGS)
+        else:
+            globals()[SUBCOMMAND_FUNCTION_NAME](SUBCOMMAND, ARGS)
+    finally:
+        if PROFILER:
+            PROFILER.dump_stats(PROFILE_FILE)
+        stop_tracing()
@@ -9,4 +9,33 @@ NOT_OK=1
 
 echo "Doing testing."
 
+# SQL statement transforms need no database.
+
+echo "Testing that hash index profile indexes follow SENZING_TABLESPACE_MAP."
+python3 - <<'EOF' || exit ${NOT_OK}
+import importlib.util
+import json
+
+spec = importlib.util.spec_from_file_location("init_postgresql", "/app/init-postgresql.py")
+init_postgresql = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(init_postgresql)
+
+config = {
+    "input_sql_url": "file:///opt/senzing/g2/resources/schema/g2core-schema-postgresql-create.sql",
+    "index_profile": "hash",
+    "tablespace_map": json.dumps({"DSRC_RECORD_H*": "fast"}),
+}
+hash_indexes = [
+    sql_statement
+    for sql_statement in init_postgresql.transform_sql_statements(
+        init_postgresql.read_sql_statements(config.get("input_sql_url")),
+        init_postgresql.get_sql_context(config),
+    )
+    if "USING HASH" in sql_statement.upper()
+]
+assert len(hash_indexes) == 2, hash_indexes
+for sql_statement in hash_indexes:
+    assert "TABLESPACE fast" in sql_statement, sql_statement
+EOF
+
 exit ${OK}